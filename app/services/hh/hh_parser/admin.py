@@ -1,7 +1,12 @@
 from django.contrib import admin
+from django.db.models import Q
 
 from ...utils.main import custom_title_filter_factory
-from .models import Vacancy
+from .fulltext import full_text_supported, search_query
+from .models import CrawlPlan, Vacancy
+
+# поля справочников, которых нет в search_vector
+NAME_SEARCH_FIELDS = ("company__name", "city__name", "platform__name")
 
 
 @admin.register(Vacancy)
@@ -29,6 +34,20 @@ class VacancyAdmin(admin.ModelAdmin):
     ordering = ("-published_at",)
     readonly_fields = ("created_at", "platform")
 
+    def get_search_results(self, request, queryset, search_term):
+        # в PostgreSQL каждое слово ищем по search_vector (название, навыки,
+        # описание) или, как и раньше, через icontains по компании, городу
+        # и площадке
+        if not search_term or not full_text_supported(queryset):
+            return super().get_search_results(request, queryset, search_term)
+        condition = Q()
+        for word in search_term.split():
+            word_condition = Q(search_vector=search_query(word))
+            for field in NAME_SEARCH_FIELDS:
+                word_condition |= Q(**{f"{field}__icontains": word})
+            condition &= word_condition
+        return queryset.filter(condition), False
+
     fieldsets = (
         (
             "Description",
@@ -57,3 +76,18 @@ class VacancyAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(CrawlPlan)
+class CrawlPlanAdmin(admin.ModelAdmin):
+    list_display = (
+        "text",
+        "area",
+        "professional_role",
+        "schedule",
+        "is_active",
+        "created_at",
+    )
+    list_editable = ("is_active",)
+    list_filter = ("is_active", "area", "schedule")
+    search_fields = ("text",)
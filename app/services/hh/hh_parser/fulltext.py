@@ -0,0 +1,67 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+
+# вакансии пишутся по-русски, но стек и названия должностей часто
+# по-английски, поэтому текст индексируется в обеих конфигурациях
+SEARCH_CONFIGS = ("russian", "english")
+SEARCH_WEIGHTS = {"title": "A", "skills": "B", "description": "C"}
+FALLBACK_FIELDS = ("title", "skills", "description")
+
+
+def full_text_supported(queryset):
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def search_vector():
+    """Выражение для Vacancy.search_vector: название важнее навыков,
+    навыки важнее описания."""
+    vector = None
+    for config in SEARCH_CONFIGS:
+        for field, weight in SEARCH_WEIGHTS.items():
+            part = SearchVector(field, config=config, weight=weight)
+            vector = part if vector is None else vector + part
+    return vector
+
+
+def search_query(text):
+    query = None
+    for config in SEARCH_CONFIGS:
+        part = SearchQuery(text, config=config, search_type="websearch")
+        query = part if query is None else query | part
+    return query
+
+
+def update_search_vector(queryset):
+    """Пересчитывает search_vector; на базах без tsvector ничего не делает."""
+    if full_text_supported(queryset):
+        queryset.update(search_vector=search_vector())
+
+
+def search_vacancies(queryset, text):
+    """Вакансии, подходящие под запрос, с релевантностью в `rank`.
+
+    В PostgreSQL используется полнотекстовый поиск по GIN-индексу
+    search_vector. На других базах, например SQLite при локальной
+    разработке, каждое слово запроса ищется через icontains, а `rank`
+    равен нулю.
+    """
+    if full_text_supported(queryset):
+        query = search_query(text)
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-published_at")
+        )
+
+    condition = Q()
+    for word in text.split():
+        word_condition = Q()
+        for field in FALLBACK_FIELDS:
+            word_condition |= Q(**{f"{field}__icontains": word})
+        condition &= word_condition
+    return (
+        queryset.filter(condition)
+        .annotate(rank=Value(0.0, output_field=FloatField()))
+        .order_by("-published_at")
+    )
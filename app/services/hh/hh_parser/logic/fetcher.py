@@ -0,0 +1,92 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from ....ingestion.http import ApiClient, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+HH_VACANCY_DETAIL_URL = "https://api.hh.ru/vacancies/{}"
+HH_HEADERS = {"User-Agent": "HH-User-Agent"}
+
+
+def build_hh_client(rate=None, pool_size=None):
+    """Один клиент на запуск: поиск и детальные запросы делят пул
+    соединений и лимит запросов к api.hh.ru."""
+    pool_size = pool_size or settings.HH_DETAIL_CONCURRENCY
+    bucket = TokenBucket(rate or settings.HH_RATE_LIMIT, capacity=pool_size)
+    return ApiClient(headers=HH_HEADERS, pool_size=pool_size, bucket=bucket)
+
+
+@dataclass
+class BatchStats:
+    size: int
+    fetched: int
+    failed: int
+    seconds: float
+
+    @property
+    def per_second(self):
+        return self.fetched / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {
+            "size": self.size,
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 3),
+            "per_second": round(self.per_second, 2),
+        }
+
+
+class DetailFetcher:
+    def __init__(self, client=None, max_workers=None, batch_size=None):
+        self.max_workers = max_workers or settings.HH_DETAIL_CONCURRENCY
+        self.batch_size = batch_size or settings.HH_DETAIL_BATCH_SIZE
+        self.client = client or build_hh_client(pool_size=self.max_workers)
+        self.stats = []
+
+    def fetch_one(self, vacancy_id):
+        return self.client.get_json(HH_VACANCY_DETAIL_URL.format(vacancy_id))
+
+    def fetch(self, vacancy_ids):
+        """Отдаёт кортежи (vacancy_id, item, error) по мере готовности.
+
+        Сохранение результатов остаётся в вызывающем потоке, поэтому ORM
+        не используется из рабочих потоков пула.
+        """
+        vacancy_ids = list(vacancy_ids)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, len(vacancy_ids), self.batch_size):
+                batch = vacancy_ids[start : start + self.batch_size]
+                started = time.monotonic()
+                futures = {
+                    executor.submit(self.fetch_one, vacancy_id): vacancy_id
+                    for vacancy_id in batch
+                }
+                fetched, failed = 0, 0
+                for future in as_completed(futures):
+                    vacancy_id = futures[future]
+                    try:
+                        item = future.result()
+                    except Exception as e:
+                        failed += 1
+                        yield vacancy_id, None, e
+                        continue
+                    fetched += 1
+                    yield vacancy_id, item, None
+
+                stats = BatchStats(
+                    size=len(batch),
+                    fetched=fetched,
+                    failed=failed,
+                    seconds=time.monotonic() - started,
+                )
+                self.stats.append(stats)
+                logger.info(
+                    f"HH: пакет из {stats.size} вакансий за {stats.seconds:.2f} с "
+                    f"({stats.per_second:.1f} вак/с, ошибок: {stats.failed})"
+                )
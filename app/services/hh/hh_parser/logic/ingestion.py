@@ -0,0 +1,145 @@
+import logging
+
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+
+from ....ingestion.engine import IngestionEngine
+from ....ingestion.salary import salary_fields
+from ....ingestion.sources import VacancySource, fingerprint
+from ....ingestion.text import html_to_text
+from ..models import CrawlPlan, Platform
+from .fetcher import DetailFetcher, build_hh_client
+from .search import HH_MAX_PER_PAGE, SearchCrawler
+
+logger = logging.getLogger(__name__)
+
+# используется, пока в админке не заведено ни одного активного плана
+DEFAULT_PLAN = {"text": "Python", "area": 1}
+
+
+def list_fingerprint(item):
+    """Хеш полей вакансии из поисковой выдачи HH.
+
+    HH обновляет published_at при republish вакансии, а зарплата, название,
+    работодатель и регион видны прямо в выдаче, поэтому их совпадения
+    достаточно, чтобы не запрашивать детальную карточку повторно.
+    """
+    return fingerprint(
+        [
+            item.get("published_at"),
+            item.get("created_at"),
+            item.get("name"),
+            item.get("salary"),
+            (item.get("employer") or {}).get("name"),
+            (item.get("area") or {}).get("name"),
+            item.get("archived"),
+        ]
+    )
+
+
+def map_vacancy(item):
+    employer = item.get("employer", {})
+    company = employer.get("name")
+
+    city, full_address = None, None
+    address = item.get("address")
+    if address:
+        city = address.get("city")
+        full_address = address.get("raw")
+
+    salary_data = item.get("salary") or {}
+    salary = ""
+    if salary_data:
+        salary_parts = []
+        if salary_data.get("from"):
+            salary_parts.append(f"от {salary_data['from']}")
+        if salary_data.get("to"):
+            salary_parts.append(f"до {salary_data['to']}")
+        if salary_data.get("currency"):
+            salary_parts.append(salary_data["currency"])
+        salary = " ".join(salary_parts)
+
+    description = html_to_text(item.get("description"))
+
+    work_format = ", ".join([work["name"] for work in item.get("work_format", [])])
+    skills = ", ".join([skill["name"] for skill in item.get("key_skills", [])])
+
+    title = item.get("name")
+    url = item.get("alternate_url")
+    experience = item.get("experience").get("name") if item.get("experience") else None
+    schedule = item.get("schedule").get("name") if item.get("schedule") else None
+    education = item.get("education", {}).get("level", {}).get("name")
+    employment = item.get("employment", {}).get("name")
+    contacts = item.get("contacts")
+    published_at = item.get("published_at")
+    platform_vacancy_id = f"{Platform.HH}{item.get('id')}"
+
+    return {
+        "platform": Platform.HH,
+        "city": city,
+        "company": company,
+        "platform_vacancy_id": platform_vacancy_id,
+        "title": title,
+        "salary": salary,
+        "url": url,
+        "experience": experience,
+        "schedule": schedule,
+        "work_format": work_format,
+        "skills": skills,
+        "education": education,
+        "description": description,
+        "address": full_address,
+        "employment": employment,
+        "contacts": contacts,
+        "published_at": published_at,
+        **salary_fields(
+            salary_data.get("from"),
+            salary_data.get("to"),
+            salary_data.get("currency"),
+            salary_data.get("gross"),
+        ),
+    }
+
+
+def active_plans():
+    plans = [plan.params for plan in CrawlPlan.objects.filter(is_active=True)]
+    return plans or [DEFAULT_PLAN]
+
+
+class HHSource(VacancySource):
+    """Поиск по планам из админки и догрузка детальных карточек, которых
+    нет в поисковой выдаче HH."""
+
+    platform = Platform.HH
+    mapper = staticmethod(map_vacancy)
+
+    def __init__(self, client=None, per_page=HH_MAX_PER_PAGE):
+        self.client = client or build_hh_client()
+        self.per_page = per_page
+        self.query_concurrency = settings.HH_PLAN_CONCURRENCY
+        self.fetcher = DetailFetcher(self.client)
+
+    def default_queries(self):
+        return active_plans()
+
+    def search(self, params, since=None):
+        crawler = SearchCrawler(self.client, per_page=self.per_page)
+        items = list(crawler.iter_items(params, date_from=since))
+        return items, crawler.pages_fetched
+
+    def published_at(self, item):
+        return parse_datetime(item["published_at"])
+
+    def fingerprint(self, item):
+        return list_fingerprint(item)
+
+    def fetch(self, items):
+        return self.fetcher.fetch(self.item_id(item) for item in items)
+
+    def stats(self):
+        return {"batches": [stats.as_dict() for stats in self.fetcher.stats]}
+
+
+def sync_hh(plans=None, per_page=HH_MAX_PER_PAGE, full=False, parse_workers=None):
+    source = HHSource(per_page=per_page)
+    return IngestionEngine(source, parse_workers=parse_workers).sync(plans, full)
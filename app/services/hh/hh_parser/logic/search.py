@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from ....ingestion.windows import WindowCrawler
+from .fetcher import build_hh_client
+
+HH_VACANCIES_URL = "https://api.hh.ru/vacancies"
+# HH отдаёт не больше 2000 результатов на один поисковый запрос
+HH_MAX_DEPTH = 2000
+HH_MAX_PER_PAGE = 100
+
+
+class SearchCrawler(WindowCrawler):
+    """Обходит все страницы поиска HH.
+
+    Если запрос находит больше HH_MAX_DEPTH вакансий, окно публикации
+    делится пополам до тех пор, пока каждое окно не станет обходимым.
+    """
+
+    name = "HH"
+    max_depth = HH_MAX_DEPTH
+
+    def __init__(self, client=None, per_page=HH_MAX_PER_PAGE):
+        super().__init__()
+        self.client = client or build_hh_client()
+        self.per_page = min(per_page, HH_MAX_PER_PAGE)
+
+    def fetch_page(self, params, page):
+        data = self.client.get_json(
+            HH_VACANCIES_URL,
+            params={**params, "per_page": self.per_page, "page": page},
+        )
+        self.pages_fetched += 1
+        return data
+
+    def iter_items(self, params, date_from=None, date_to=None):
+        date_to = date_to or timezone.now()
+        date_from = date_from or date_to - timedelta(days=settings.HH_SEARCH_PERIOD_DAYS)
+        yield from self.iter_windows(params, date_from, date_to)
+
+    def window_params(self, params, date_from, date_to):
+        return {
+            **params,
+            "date_from": date_from.isoformat(timespec="seconds"),
+            "date_to": date_to.isoformat(timespec="seconds"),
+        }
+
+    def total(self, first_page):
+        return first_page.get("found", 0)
+
+    def iter_window(self, window_params, first_page):
+        yield from first_page.get("items", [])
+
+        max_pages = HH_MAX_DEPTH // self.per_page
+        pages = min(first_page.get("pages", 1), max_pages)
+        for page in range(1, pages):
+            yield from self.fetch_page(window_params, page).get("items", [])
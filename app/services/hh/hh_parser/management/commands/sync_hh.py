@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.services.hh.hh_parser.logic.ingestion import sync_hh
+from app.services.hh.hh_parser.logic.search import HH_MAX_PER_PAGE
+from app.services.hh.hh_parser.models import Platform
+from app.services.ingestion.dedup import DuplicateDetector
+from app.services.ingestion.models import IngestionRun
+from app.services.ingestion.runs import claim_run, execute_run
+
+
+class Command(BaseCommand):
+    help = "Загружает вакансии HH вне HTTP-запроса"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--text", help="Разовый запрос вместо активных планов из админки"
+        )
+        parser.add_argument("--area", type=int, default=1)
+        parser.add_argument("--per-page", type=int, default=HH_MAX_PER_PAGE)
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Игнорировать watermark и загрузить всё окно поиска",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            help="Процессов для разбора ответов API, 0 — разбор в потоке",
+        )
+        parser.add_argument(
+            "--skip-dedup",
+            action="store_true",
+            help="Не искать дубликаты среди новых и изменившихся вакансий",
+        )
+
+    def handle(self, *args, **options):
+        plans = None
+        if options["text"]:
+            plans = [{"text": options["text"], "area": options["area"]}]
+
+        run = claim_run(Platform.HH)
+        if run is None:
+            self.stdout.write(
+                self.style.WARNING("HH: предыдущий запуск ещё выполняется")
+            )
+            return
+        self.stdout.write(f"Запуск HH #{run.id}")
+        run = execute_run(
+            run,
+            sync_hh,
+            plans=plans,
+            per_page=options["per_page"],
+            full=options["full"],
+            parse_workers=options["parse_workers"],
+        )
+
+        for error in run.errors:
+            self.stderr.write(error)
+        if run.status == IngestionRun.FAILED:
+            raise CommandError(run.message)
+        self.stdout.write(self.style.SUCCESS(run.message))
+        if not options["skip_dedup"]:
+            detector = DuplicateDetector().run()
+            self.stdout.write(
+                f"Дубликаты: обработано {detector.processed} вакансий, "
+                f"найдено {detector.linked}"
+            )
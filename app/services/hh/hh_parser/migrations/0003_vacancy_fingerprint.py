@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0002_city_company_platform_remove_vacancy_area_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:14
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def drop_duplicate_platform_ids(apps, schema_editor):
+    Vacancy = apps.get_model('hh_parser', 'Vacancy')
+    duplicates = (
+        Vacancy.objects.exclude(platform_vacancy_id=None)
+        .values('platform_vacancy_id')
+        .annotate(rows=Count('id'), keep_id=Max('id'))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates:
+        Vacancy.objects.filter(
+            platform_vacancy_id=duplicate['platform_vacancy_id']
+        ).exclude(id=duplicate['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0003_vacancy_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_platform_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='vacancy',
+            name='platform_vacancy_id',
+            field=models.CharField(max_length=25, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0004_alter_vacancy_platform_vacancy_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlPlan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.CharField(max_length=255)),
+                ('area', models.PositiveIntegerField(default=1)),
+                ('professional_role', models.PositiveIntegerField(blank=True, null=True)),
+                ('schedule', models.CharField(blank=True, choices=[('fullDay', 'Полный день'), ('shift', 'Сменный график'), ('flexible', 'Гибкий график'), ('remote', 'Удаленная работа'), ('flyInFlyOut', 'Вахтовый метод')], default='', max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0005_crawlplan'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_currency',
+            field=models.CharField(blank=True, default='', max_length=3),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_from',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_gross',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_rub_monthly',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='salary_to',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
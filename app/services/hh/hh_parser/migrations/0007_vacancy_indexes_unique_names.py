@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:41
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_names(apps, schema_editor):
+    Vacancy = apps.get_model('hh_parser', 'Vacancy')
+    for model_name, field in (('Company', 'company'), ('City', 'city')):
+        model = apps.get_model('hh_parser', model_name)
+        duplicates = (
+            model.objects.values('name')
+            .annotate(rows=Count('id'), keep_id=Min('id'))
+            .filter(rows__gt=1)
+        )
+        for duplicate in duplicates:
+            extra_ids = list(
+                model.objects.filter(name=duplicate['name'])
+                .exclude(id=duplicate['keep_id'])
+                .values_list('id', flat=True)
+            )
+            Vacancy.objects.filter(**{f'{field}_id__in': extra_ids}).update(
+                **{f'{field}_id': duplicate['keep_id']}
+            )
+            model.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0006_vacancy_salary_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_names, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='city',
+            name='name',
+            field=models.CharField(max_length=50, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='company',
+            name='name',
+            field=models.CharField(max_length=150, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['platform', '-published_at'], name='vacancy_platform_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['city', '-published_at'], name='vacancy_city_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['-published_at'], name='vacancy_published_idx'),
+        ),
+    ]
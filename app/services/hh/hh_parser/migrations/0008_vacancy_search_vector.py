@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:43
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+INDEX_NAME = 'vacancy_search_vector_gin'
+
+
+def search_vector():
+    # выражение на момент миграции; текущее — в hh_parser/fulltext.py
+    return (
+        SearchVector('title', config='russian', weight='A')
+        + SearchVector('skills', config='russian', weight='B')
+        + SearchVector('description', config='russian', weight='C')
+        + SearchVector('title', config='english', weight='A')
+        + SearchVector('skills', config='english', weight='B')
+        + SearchVector('description', config='english', weight='C')
+    )
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+        'ON hh_parser_vacancy USING gin (search_vector)'
+    )
+    Vacancy = apps.get_model('hh_parser', 'Vacancy')
+    Vacancy.objects.update(search_vector=search_vector())
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0007_vacancy_indexes_unique_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
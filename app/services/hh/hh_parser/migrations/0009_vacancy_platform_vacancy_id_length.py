@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0008_vacancy_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vacancy',
+            name='platform_vacancy_id',
+            field=models.CharField(max_length=64, null=True, unique=True),
+        ),
+    ]
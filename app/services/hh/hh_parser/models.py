@@ -1,5 +1,8 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+from .fulltext import update_search_vector
+
 
 class Platform(models.Model):
     HH = "HeadHunter"
@@ -19,14 +22,14 @@ class Platform(models.Model):
 
 
 class Company(models.Model):
-    name = models.CharField(max_length=150)
+    name = models.CharField(max_length=150, unique=True)
 
     def __str__(self):
         return f"{self.name}"
 
 
 class City(models.Model):
-    name = models.CharField(max_length=50)
+    name = models.CharField(max_length=50, unique=True)
 
     def __str__(self):
         return f"{self.name}"
@@ -42,10 +45,19 @@ class Vacancy(models.Model):
     city = models.ForeignKey(
         City, related_name="vacancies", on_delete=models.SET_NULL, null=True
     )
-    platform_vacancy_id = models.CharField(max_length=25, null=True)
+    platform_vacancy_id = models.CharField(max_length=64, unique=True, null=True)
+    fingerprint = models.CharField(max_length=40, default="", blank=True)
     title = models.CharField(max_length=255)
     url = models.URLField(unique=True, default="", blank=True, null=True)
     salary = models.CharField(max_length=120, default="", blank=True, null=True)
+    salary_from = models.PositiveIntegerField(null=True, blank=True)
+    salary_to = models.PositiveIntegerField(null=True, blank=True)
+    salary_currency = models.CharField(max_length=3, default="", blank=True)
+    salary_gross = models.BooleanField(null=True, blank=True)
+    # середина вилки в рублях на руки, по курсам INGESTION_CURRENCY_RATES_FILE
+    salary_rub_monthly = models.PositiveIntegerField(
+        null=True, blank=True, db_index=True
+    )
     experience = models.CharField(max_length=50, default="", blank=True, null=True)
     employment = models.CharField(max_length=40, default="", blank=True, null=True)
     work_format = models.CharField(max_length=255, default="", blank=True, null=True)
@@ -57,6 +69,56 @@ class Vacancy(models.Model):
     contacts = models.CharField(max_length=250, default="", blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     published_at = models.DateTimeField()
+    # заполняется только в PostgreSQL, см. fulltext.py; GIN-индекс создаётся
+    # миграцией 0008, потому что в SQLite такого индекса нет
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # свежие вакансии площадки и города: фильтр по FK и сортировка
+            # берутся из одного индекса без отдельной сортировки
+            models.Index(
+                fields=["platform", "-published_at"], name="vacancy_platform_pub_idx"
+            ),
+            models.Index(fields=["city", "-published_at"], name="vacancy_city_pub_idx"),
+            models.Index(fields=["-published_at"], name="vacancy_published_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} в {self.company}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # bulk-запись пересчитывает вектор сама, см. VacancyBatchWriter
+        update_search_vector(Vacancy.objects.filter(pk=self.pk))
+
+
+class CrawlPlan(models.Model):
+    SCHEDULE_CHOICES = [
+        ("fullDay", "Полный день"),
+        ("shift", "Сменный график"),
+        ("flexible", "Гибкий график"),
+        ("remote", "Удаленная работа"),
+        ("flyInFlyOut", "Вахтовый метод"),
+    ]
+
+    text = models.CharField(max_length=255)
+    area = models.PositiveIntegerField(default=1)
+    professional_role = models.PositiveIntegerField(null=True, blank=True)
+    schedule = models.CharField(
+        max_length=20, choices=SCHEDULE_CHOICES, default="", blank=True
+    )
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.text} (area {self.area})"
+
+    @property
+    def params(self):
+        params = {"text": self.text, "area": self.area}
+        if self.professional_role:
+            params["professional_role"] = self.professional_role
+        if self.schedule:
+            params["schedule"] = self.schedule
+        return params
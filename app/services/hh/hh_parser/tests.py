@@ -1,3 +1,351 @@
-# from django.test import TestCase
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib import admin
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from app.services.hh.hh_parser.admin import VacancyAdmin
+from app.services.hh.hh_parser.logic.fetcher import DetailFetcher, build_hh_client
+from app.services.hh.hh_parser.logic.ingestion import list_fingerprint, sync_hh
+from app.services.hh.hh_parser.logic.search import HH_VACANCIES_URL, SearchCrawler
+from app.services.hh.hh_parser.models import City, Company, CrawlPlan, Vacancy
+from app.services.ingestion.engine import next_watermark
+from app.services.ingestion.models import IngestionRun, SyncWatermark
+
+
+def fake_response(payload):
+    return SimpleNamespace(raise_for_status=lambda: None, json=lambda: payload)
+
+
+def fast_client():
+    return build_hh_client(rate=1000, pool_size=4)
+
+
+def hh_detail(vacancy_id, **overrides):
+    return {
+        "id": vacancy_id,
+        "name": "Python-разработчик",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "employer": {"name": "Яндекс"},
+        "address": {"city": "Москва", "raw": "Москва, ул. Льва Толстого, 16"},
+        "salary": {"from": 150000, "to": 250000, "currency": "RUR"},
+        "description": "<p>Пишем <b>сервисы</b></p>",
+        "key_skills": [{"name": "Python"}, {"name": "Django"}],
+        "work_format": [{"name": "Удалённо"}],
+        "experience": {"name": "От 1 года до 3 лет"},
+        "schedule": {"name": "Полный день"},
+        "education": {"level": {"name": "Высшее"}},
+        "employment": {"name": "Полная занятость"},
+        "published_at": "2025-06-30T10:00:00+0300",
+        **overrides,
+    }
+
+
+class DetailFetcherTests(SimpleTestCase):
+    def test_fetches_all_ids_and_reports_batches(self):
+        with patch(
+            "requests.Session.get",
+            side_effect=lambda url, **kw: fake_response({"id": url.rsplit("/", 1)[1]}),
+        ):
+            fetcher = DetailFetcher(fast_client(), max_workers=4, batch_size=3)
+            results = list(fetcher.fetch([str(i) for i in range(7)]))
+
+        self.assertEqual(
+            sorted(item["id"] for _, item, _ in results), [str(i) for i in range(7)]
+        )
+        self.assertEqual([stats.size for stats in fetcher.stats], [3, 3, 1])
+        self.assertEqual(sum(stats.fetched for stats in fetcher.stats), 7)
+
+    def test_errors_are_returned_per_vacancy(self):
+        def get(url, **kwargs):
+            if url.endswith("/2"):
+                raise ValueError("boom")
+            return fake_response({"id": url.rsplit("/", 1)[1]})
+
+        with patch("requests.Session.get", side_effect=get):
+            fetcher = DetailFetcher(fast_client(), max_workers=2, batch_size=10)
+            results = list(fetcher.fetch(["1", "2", "3"]))
+
+        errors = {vacancy_id: error for vacancy_id, _, error in results if error}
+        self.assertEqual(list(errors), ["2"])
+        self.assertEqual(fetcher.stats[0].failed, 1)
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def get(url, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return fake_response({})
+
+        with patch("requests.Session.get", side_effect=get):
+            fetcher = DetailFetcher(fast_client(), max_workers=3, batch_size=20)
+            list(fetcher.fetch([str(i) for i in range(20)]))
+
+        self.assertLessEqual(state["peak"], 3)
+
+
+class SearchCrawlerTests(SimpleTestCase):
+    def setUp(self):
+        self.date_to = datetime(2025, 6, 30, tzinfo=timezone.utc)
+        self.date_from = self.date_to - timedelta(days=2)
+
+    def crawl(self, get):
+        crawler = SearchCrawler(fast_client(), per_page=100)
+        with patch("requests.Session.get", side_effect=get):
+            items = list(
+                crawler.iter_items({"text": "Python"}, self.date_from, self.date_to)
+            )
+        return crawler, items
+
+    def test_walks_all_pages(self):
+        def get(url, params, **kwargs):
+            page = params["page"]
+            items = [{"id": f"{page}-{i}"} for i in range(params["per_page"])]
+            return fake_response({"found": 250, "pages": 3, "items": items})
+
+        crawler, items = self.crawl(get)
+
+        self.assertEqual(crawler.pages_fetched, 3)
+        self.assertEqual(len(items), 300)
+
+    def test_splits_window_when_depth_limit_exceeded(self):
+        windows = []
+
+        def get(url, params, **kwargs):
+            windows.append((params["date_from"], params["date_to"]))
+            found = 3000 if len(windows) == 1 else 50
+            return fake_response({"found": found, "pages": 1, "items": [{"id": "1"}]})
+
+        crawler, items = self.crawl(get)
+
+        self.assertEqual(
+            windows[1:],
+            [
+                ("2025-06-28T00:00:00+00:00", "2025-06-29T00:00:00+00:00"),
+                ("2025-06-29T00:00:00+00:00", "2025-06-30T00:00:00+00:00"),
+            ],
+        )
+        self.assertEqual(len(items), 2)
+
+
+class IncrementalSyncTests(TestCase):
+    items = [
+        {"id": "1", "name": "Python dev", "published_at": "2025-06-29T10:00:00+0300"},
+        {"id": "2", "name": "Django dev", "published_at": "2025-06-30T10:00:00+0300"},
+    ]
+
+    def setUp(self):
+        self.search_params = []
+        self.detail_urls = []
+
+    def get(self, url, params=None, **kwargs):
+        if url != HH_VACANCIES_URL:
+            self.detail_urls.append(url)
+            return fake_response(hh_detail(url.rsplit("/", 1)[1]))
+        self.search_params.append(params)
+        return fake_response({"found": 2, "pages": 1, "items": self.items})
+
+    def sync(self, **kwargs):
+        with patch("requests.Session.get", side_effect=self.get):
+            return sync_hh(**kwargs)
+
+    def test_second_run_starts_from_watermark(self):
+        self.sync()
+        self.sync()
+
+        watermark = SyncWatermark.objects.get(source="HeadHunter")
+        self.assertEqual(
+            watermark.last_published_at,
+            datetime(2025, 6, 30, 7, 0, tzinfo=timezone.utc),
+        )
+        self.assertEqual(self.search_params[1]["date_from"], "2025-06-30T06:55:00+00:00")
+
+    def test_full_run_ignores_watermark(self):
+        self.sync()
+        self.sync(full=True)
+
+        self.assertNotEqual(
+            self.search_params[1]["date_from"], "2025-06-30T06:55:00+00:00"
+        )
+
+    def test_unchanged_vacancies_are_not_fetched(self):
+        Vacancy.objects.create(
+            platform_vacancy_id="HeadHunter1",
+            title="Python dev",
+            url="https://hh.ru/vacancy/1",
+            published_at=datetime(2025, 6, 29, 7, tzinfo=timezone.utc),
+            fingerprint=list_fingerprint(self.items[0]),
+        )
+
+        result = self.sync()
+
+        self.assertEqual(self.detail_urls, ["https://api.hh.ru/vacancies/2"])
+        self.assertEqual(result["skipped_count"], 1)
+        self.assertEqual(result["saved_count"], 1)
+
+    def test_vacancies_are_upserted_once(self):
+        self.sync()
+        self.sync(full=True)
+
+        self.assertEqual(Vacancy.objects.count(), 2)
+        vacancy = Vacancy.objects.get(platform_vacancy_id="HeadHunter2")
+        self.assertEqual(vacancy.company.name, "Яндекс")
+        self.assertEqual(vacancy.salary, "от 150000 до 250000 RUR")
+        self.assertEqual(
+            (vacancy.salary_from, vacancy.salary_to, vacancy.salary_currency),
+            (150000, 250000, "RUB"),
+        )
+        self.assertEqual(vacancy.salary_rub_monthly, 200000)
+        self.assertEqual(vacancy.skills, "Python, Django")
+
+    def test_plans_are_deduplicated_before_detail_fetch(self):
+        CrawlPlan.objects.create(text="Python", area=1)
+        CrawlPlan.objects.create(text="Django", area=2, schedule="remote")
+        CrawlPlan.objects.create(text="Go", area=1, is_active=False)
+
+        self.sync()
+
+        self.assertEqual(
+            sorted(params["text"] for params in self.search_params), ["Django", "Python"]
+        )
+        self.assertEqual(len(self.detail_urls), 2)
+        self.assertEqual(
+            set(SyncWatermark.objects.values_list("query", flat=True)),
+            {"area=1&text=Python", "area=2&schedule=remote&text=Django"},
+        )
+
+    def test_fingerprint_changes_with_list_fields(self):
+        changed = {**self.items[0], "salary": {"from": 100000, "currency": "RUR"}}
+        self.assertNotEqual(list_fingerprint(self.items[0]), list_fingerprint(changed))
+
+    def test_failed_vacancy_holds_watermark_back(self):
+        published = {
+            "1": datetime(2025, 6, 29, tzinfo=timezone.utc),
+            "2": datetime(2025, 6, 30, tzinfo=timezone.utc),
+        }
+        self.assertEqual(
+            next_watermark(published, ["2"]),
+            datetime(2025, 6, 29, 23, 55, tzinfo=timezone.utc),
+        )
+        self.assertEqual(next_watermark(published, []), published["2"])
+
+
+class VacancyListViewTests(TestCase):
+    def test_enqueues_run_and_returns_its_id(self):
+        resp = self.client.get(reverse("vacancy_list"))
+
+        self.assertEqual(resp.status_code, 202)
+        run = IngestionRun.objects.get(id=resp.json()["run_id"])
+        self.assertEqual(run.source, "HeadHunter")
+        self.assertEqual(run.status, IngestionRun.PENDING)
+
+    def test_refuses_while_run_is_active(self):
+        run = IngestionRun.objects.create(
+            source="HeadHunter", status=IngestionRun.RUNNING
+        )
+
+        resp = self.client.get(reverse("vacancy_list"))
+
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(resp.json()["run_id"], run.id)
+        self.assertEqual(IngestionRun.objects.count(), 1)
+
+
+class VacancyIndexTests(TestCase):
+    """Горячие запросы должны идти по индексам, а не полным сканированием."""
+
+    def setUp(self):
+        if connection.vendor == "postgresql":
+            # на маленькой тестовой таблице планировщик иначе выберет seq scan
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index_name=None):
+        plan = queryset.explain()
+        if index_name:
+            self.assertIn(index_name, plan)
+        else:
+            self.assertRegex(plan, r"(?i)index")
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan)
+
+    def test_latest_by_platform_and_city(self):
+        self.assertUsesIndex(
+            Vacancy.objects.filter(platform_id=1).order_by("-published_at"),
+            "vacancy_platform_pub_idx",
+        )
+        self.assertUsesIndex(
+            Vacancy.objects.filter(city_id=1).order_by("-published_at"),
+            "vacancy_city_pub_idx",
+        )
+        self.assertUsesIndex(
+            Vacancy.objects.order_by("-published_at"), "vacancy_published_idx"
+        )
+
+    def test_upsert_and_dimension_lookups(self):
+        self.assertUsesIndex(
+            Vacancy.objects.filter(platform_vacancy_id__in=["HeadHunter1"])
+        )
+        self.assertUsesIndex(Company.objects.filter(name__in=["Яндекс"]))
+        self.assertUsesIndex(City.objects.filter(name__in=["Москва"]))
+
+
+class VacancySearchTests(TestCase):
+    def setUp(self):
+        published = datetime(2025, 6, 30, tzinfo=timezone.utc)
+        self.django = Vacancy.objects.create(
+            title="Python-разработчик",
+            url="https://example.com/1",
+            skills="Django, PostgreSQL",
+            published_at=published,
+        )
+        Vacancy.objects.create(
+            title="Go-разработчик",
+            url="https://example.com/2",
+            description="Пишем на Go, немного Python",
+            published_at=published + timedelta(days=1),
+        )
+
+    def search(self, **params):
+        return self.client.get(reverse("vacancy_search"), params)
+
+    def test_matches_every_word(self):
+        resp = self.search(q="python django")
+
+        self.assertEqual(resp.status_code, 200)
+        results = resp.json()["results"]
+        self.assertEqual([r["id"] for r in results], [self.django.id])
+
+    def test_ranks_title_above_description(self):
+        results = self.search(q="python").json()["results"]
+
+        self.assertEqual(len(results), 2)
+        if connection.vendor == "postgresql":
+            self.assertEqual(results[0]["id"], self.django.id)
+            self.assertGreater(results[0]["rank"], results[1]["rank"])
+
+    def test_admin_also_searches_company_names(self):
+        self.django.company = Company.objects.create(name="Яндекс")
+        self.django.save()
+        vacancy_admin = VacancyAdmin(Vacancy, admin.site)
+
+        for term in ("Яндекс", "python Яндекс"):
+            with self.subTest(term=term):
+                found, _ = vacancy_admin.get_search_results(
+                    None, Vacancy.objects.all(), term
+                )
+                self.assertIn(self.django, found)
+
+    def test_query_is_required(self):
+        self.assertEqual(self.search().status_code, 400)
+        self.assertEqual(self.search(q="python", limit="x").status_code, 400)
@@ -1,7 +1,8 @@
-from django.urls import path
-
-from . import views
-
-urlpatterns = [
-    path("", views.vacancy_list, name="vacancy_list"),
-]
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("", views.vacancy_list, name="vacancy_list"),
+    path("search/", views.vacancy_search, name="vacancy_search"),
+]
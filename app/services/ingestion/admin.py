@@ -0,0 +1,75 @@
+from django.contrib import admin
+
+from .models import IngestionRun
+
+
+@admin.register(IngestionRun)
+class IngestionRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "source",
+        "status",
+        "started_at",
+        "duration_seconds",
+        "pages_fetched",
+        "inserted_count",
+        "updated_count",
+        "skipped_count",
+        "http_p95_ms",
+        "parse_seconds",
+        "write_seconds",
+    )
+    list_filter = ("source", "status")
+    ordering = ("-created_at",)
+    readonly_fields = [field.name for field in IngestionRun._meta.fields] + [
+        "duration_seconds"
+    ]
+
+    fieldsets = (
+        (
+            "Run",
+            {
+                "fields": (
+                    "source",
+                    "status",
+                    "message",
+                    "created_at",
+                    "started_at",
+                    "finished_at",
+                    "duration_seconds",
+                )
+            },
+        ),
+        (
+            "Vacancies",
+            {
+                "fields": (
+                    "saved_count",
+                    "inserted_count",
+                    "updated_count",
+                    "skipped_count",
+                )
+            },
+        ),
+        (
+            "Timing",
+            {
+                "fields": (
+                    "pages_fetched",
+                    "http_requests",
+                    "http_p50_ms",
+                    "http_p95_ms",
+                    "http_p99_ms",
+                    "parse_seconds",
+                    "write_seconds",
+                )
+            },
+        ),
+        (
+            "Errors",
+            {"fields": ("errors_by_class", "errors"), "classes": ("collapse",)},
+        ),
+    )
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,90 @@
+import gzip
+import json
+import threading
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def get_archive():
+    if not settings.INGESTION_ARCHIVE_ENABLED:
+        return None
+    return RawArchive(settings.INGESTION_ARCHIVE_DIR)
+
+
+class RawArchive:
+    """Append-only архив сырых ответов API, разбитый по источникам и дням.
+
+    Каждая запись — JSON-строка в отдельном gzip-члене файла
+    `<root>/<source>/<YYYY-MM-DD>.jsonl.gz`, поэтому файл дописывается без
+    перепаковки и читается обычным gzip-потоком. Рядом в `.idx` для каждой
+    записи хранится строка `key<TAB>offset<TAB>length`: по ней находится
+    последняя версия вакансии без распаковки всего архива.
+
+    Запись потокобезопасна в пределах процесса; писать в один источник из
+    нескольких процессов одновременно нельзя.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def partition(self, source, day):
+        return self.root / source / f"{day.isoformat()}.jsonl.gz"
+
+    def append(self, source, key, payload, fingerprint=None, fetched_at=None):
+        fetched_at = fetched_at or timezone.now()
+        record = {
+            "key": key,
+            "fetched_at": fetched_at.isoformat(),
+            "fingerprint": fingerprint,
+            "payload": payload,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        member = gzip.compress(line.encode(), mtime=0)
+
+        path = self.partition(source, timezone.localdate(fetched_at))
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as data, open(path.with_suffix(".idx"), "a") as idx:
+                offset = data.seek(0, 2)
+                data.write(member)
+                idx.write(f"{key}\t{offset}\t{len(member)}\n")
+
+    def partitions(self, source, since=None, until=None):
+        paths = []
+        for path in sorted((self.root / source).glob("*.jsonl.gz")):
+            day = date.fromisoformat(path.name.removesuffix(".jsonl.gz"))
+            if (since and day < since) or (until and day > until):
+                continue
+            paths.append(path)
+        return paths
+
+    def iter_records(self, source, since=None, until=None):
+        """Все записи подряд, включая повторные версии одной вакансии."""
+        for path in self.partitions(source, since, until):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def latest(self, source, since=None, until=None):
+        """Последняя версия каждой вакансии за период, по индексу."""
+        partitions = self.partitions(source, since, until)
+        locations = {}
+        for path in partitions:
+            with open(path.with_suffix(".idx")) as idx:
+                for line in idx:
+                    key, offset, length = line.rstrip("\n").split("\t")
+                    locations[key] = (path, int(offset), int(length))
+
+        by_partition = {path: [] for path in partitions}
+        for path, offset, length in locations.values():
+            by_partition[path].append((offset, length))
+
+        for path, members in by_partition.items():
+            with open(path, "rb") as data:
+                for offset, length in sorted(members):
+                    data.seek(offset)
+                    yield json.loads(gzip.decompress(data.read(length)))
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import random
+import re
+import zlib
+from array import array
+
+from django.db import transaction
+
+from ..hh.hh_parser.models import Vacancy
+from .models import DuplicateCluster, SignatureBand, VacancySignature
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+# 16 полос по 8 значений: пары с похожестью выше ~0.7 почти наверняка
+# попадают в общую корзину, а непохожие почти никогда
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+SIMILARITY_THRESHOLD = 0.8
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+WORD = re.compile(r"\w+")
+
+# фиксированное зерно: сигнатуры должны совпадать между запусками
+_random = random.Random(20250701)
+PERMUTATIONS = [
+    (_random.randrange(1, MERSENNE_PRIME), _random.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def shingles(text):
+    """Хеши word-шинглов длины SHINGLE_SIZE нормализованного текста."""
+    words = WORD.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words or [""]
+        return {zlib.crc32(" ".join(words).encode())}
+    return {
+        zlib.crc32(" ".join(words[i : i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def vacancy_text(vacancy):
+    company = vacancy.company.name if vacancy.company_id else ""
+    return " ".join(filter(None, [vacancy.title, company, vacancy.description]))
+
+
+def minhash(hashes):
+    return array(
+        "I",
+        (
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) & MAX_HASH
+            for a, b in PERMUTATIONS
+        ),
+    )
+
+
+def band_keys(signature):
+    keys = []
+    for band in range(BANDS):
+        values = signature[band * ROWS : (band + 1) * ROWS]
+        digest = hashlib.blake2b(
+            band.to_bytes(2, "little") + values.tobytes(), digest_size=8
+        ).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
+
+
+def similarity(left, right):
+    """Оценка коэффициента Жаккара по доле совпавших значений сигнатур."""
+    return sum(a == b for a, b in zip(left, right)) / NUM_PERM
+
+
+def load_signature(data):
+    signature = array("I")
+    signature.frombytes(bytes(data))
+    return signature
+
+
+class DuplicateDetector:
+    """Инкрементальный поиск почти-дубликатов вакансий через MinHash и LSH.
+
+    Обрабатываются только вакансии без сигнатуры: новые и те, чью
+    сигнатуру VacancyBatchWriter удалил при изменении. Запускается в конце
+    sync_hh, sync_superjob и reparse, а также командой dedup_vacancies.
+    Для каждой из них
+    кандидаты ищутся по совпадению LSH-корзин, а не перебором всех пар,
+    и сравниваются по сигнатурам. Совпавшие вакансии объединяются в
+    DuplicateCluster; если новая вакансия связывает несколько кластеров,
+    они сливаются в старший.
+    """
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.processed = 0
+        self.linked = 0
+
+    def pending(self):
+        return Vacancy.objects.filter(signature__isnull=True).order_by("id")
+
+    def run(self, batch_size=500):
+        last_id = 0
+        while True:
+            batch = list(
+                self.pending()
+                .filter(id__gt=last_id)
+                .select_related("company")
+                .only("id", "title", "description", "company__name")[:batch_size]
+            )
+            if not batch:
+                return self
+            last_id = batch[-1].id
+            with transaction.atomic():
+                for vacancy in batch:
+                    self.add(vacancy)
+            logger.info(f"Дубликаты: обработано {self.processed}, связано {self.linked}")
+
+    def add(self, vacancy):
+        signature = minhash(shingles(vacancy_text(vacancy)))
+        keys = band_keys(signature)
+
+        candidates = (
+            VacancySignature.objects.filter(bands__key__in=keys)
+            .distinct()
+            .only("vacancy_id", "signature", "cluster_id")
+        )
+        matches = [
+            candidate
+            for candidate in candidates
+            if similarity(signature, load_signature(candidate.signature))
+            >= self.threshold
+        ]
+
+        stored = VacancySignature.objects.create(
+            vacancy=vacancy, signature=signature.tobytes()
+        )
+        SignatureBand.objects.bulk_create(
+            [SignatureBand(signature=stored, key=key) for key in keys]
+        )
+        self.processed += 1
+        if matches:
+            self.link(stored, matches)
+            self.linked += 1
+        return stored
+
+    def link(self, stored, matches):
+        cluster_ids = sorted({m.cluster_id for m in matches if m.cluster_id})
+        if cluster_ids:
+            cluster_id = cluster_ids[0]
+            # новая вакансия связала несколько кластеров — сливаем их
+            VacancySignature.objects.filter(cluster_id__in=cluster_ids[1:]).update(
+                cluster_id=cluster_id
+            )
+            DuplicateCluster.objects.filter(id__in=cluster_ids[1:]).delete()
+            DuplicateCluster.objects.filter(id=cluster_id).update(
+                updated_at=stored.created_at
+            )
+        else:
+            cluster_id = DuplicateCluster.objects.create().id
+
+        unclustered = [m.vacancy_id for m in matches if not m.cluster_id]
+        VacancySignature.objects.filter(
+            vacancy_id__in=[stored.vacancy_id, *unclustered]
+        ).update(cluster_id=cluster_id)
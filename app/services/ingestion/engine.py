@@ -0,0 +1,242 @@
+import logging
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from ..hh.hh_parser.models import Vacancy
+from .archive import get_archive
+from .models import SyncWatermark
+from .pipeline import IngestionPipeline
+from .writer import VacancyBatchWriter
+
+logger = logging.getLogger(__name__)
+
+# площадки индексируют вакансии с задержкой, поэтому окно слегка перекрывается
+WATERMARK_OVERLAP = timedelta(minutes=5)
+FINGERPRINT_LOOKUP_CHUNK = 500
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def changed_ids(platform, fingerprints):
+    """Возвращает id вакансий, отпечаток которых отличается от сохранённого."""
+    keys = {f"{platform}{vacancy_id}": vacancy_id for vacancy_id in fingerprints}
+    stored = {}
+    platform_ids = list(keys)
+    for start in range(0, len(platform_ids), FINGERPRINT_LOOKUP_CHUNK):
+        chunk = platform_ids[start : start + FINGERPRINT_LOOKUP_CHUNK]
+        stored.update(
+            Vacancy.objects.filter(platform_vacancy_id__in=chunk).values_list(
+                "platform_vacancy_id", "fingerprint"
+            )
+        )
+    return [
+        vacancy_id
+        for key, vacancy_id in keys.items()
+        if stored.get(key) != fingerprints[vacancy_id]
+    ]
+
+
+def next_watermark(published, failed_ids):
+    """Не сдвигает watermark дальше самой ранней неудачной вакансии,
+    чтобы она попала в окно следующего запуска."""
+    if failed_ids:
+        earliest = min(published[vacancy_id] for vacancy_id in failed_ids)
+        return earliest - WATERMARK_OVERLAP
+    return max(published.values(), default=None)
+
+
+def latency_percentiles(latencies):
+    """Число HTTP-запросов и перцентили их длительности в миллисекундах."""
+    ordered = sorted(latencies)
+    result = {"http_requests": len(ordered)}
+    for percentile in LATENCY_PERCENTILES:
+        value = None
+        if ordered:
+            rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+            value = round(ordered[rank - 1] * 1000, 1)
+        result[f"http_p{percentile}_ms"] = value
+    return result
+
+
+class IngestionEngine:
+    """Загрузка вакансий площадки через её VacancySource.
+
+    Запуск состоит из поиска по всем запросам (параллельно, с общей
+    дедупликацией по id), отсева вакансий с неизменившимся отпечатком,
+    догрузки и разбора в IngestionPipeline, записи пачками через
+    VacancyBatchWriter и сдвига watermark каждого запроса. Если включён
+    INGESTION_ARCHIVE_ENABLED, загруженные ответы сохраняются в RawArchive,
+    чтобы их можно было переразобрать командой reparse.
+
+    Кроме числа сохранённых вакансий sync() возвращает метрики запуска:
+    вставлено/обновлено/пропущено, перцентили задержки API, время разбора
+    и записи и число ошибок по классам. execute_run переносит их в
+    IngestionRun.
+    """
+
+    def __init__(self, source, parse_workers=None, resolvers=None, archive=True):
+        self.source = source
+        self.parse_workers = parse_workers
+        self.resolvers = resolvers
+        self.archive = get_archive() if archive else None
+
+    def sync(self, queries=None, full=False):
+        source = self.source
+        latencies = source.client.latencies if source.client else []
+        requests_before = len(latencies)
+        queries = queries or source.default_queries()
+        watermarks = [
+            SyncWatermark.for_query(source.platform, params) for params in queries
+        ]
+
+        found = self.search(queries, watermarks, full)
+        items = found["items"]
+        fingerprints = {
+            vacancy_id: source.fingerprint(item) for vacancy_id, item in items.items()
+        }
+        if any(value is not None for value in fingerprints.values()):
+            vacancy_ids = changed_ids(source.platform, fingerprints)
+        else:
+            vacancy_ids = list(items)
+        skipped_count = len(items) - len(vacancy_ids)
+        logger.info(
+            f"{source.platform}: {len(queries)} запросов, найдено {len(items)} "
+            f"вакансий на {found['pages_fetched']} страницах, "
+            f"без изменений: {skipped_count}"
+        )
+
+        saved = self.ingest(
+            source.fetch(items[vacancy_id] for vacancy_id in vacancy_ids),
+            fingerprints,
+        )
+
+        for watermark, ids in zip(watermarks, found["query_ids"]):
+            if ids is None:
+                continue
+            published = {i: found["published"][i] for i in ids}
+            failed = [i for i in ids if i in saved["failed_ids"]]
+            watermark.advance(next_watermark(published, failed))
+
+        errors = found["errors"] + [
+            f"Вакансия {vacancy_id}: {str(error)}"
+            for vacancy_id, error in saved["errors"]
+        ]
+        errors_by_class = Counter(found["error_classes"])
+        errors_by_class.update(type(error).__name__ for _, error in saved["errors"])
+        logger.info(
+            f"{source.platform}: сохранено {saved['written']} вакансий, "
+            f"ошибок: {len(errors)}"
+        )
+        return {
+            "saved_count": saved["written"],
+            "inserted_count": saved["inserted"],
+            "updated_count": saved["updated"],
+            "skipped_count": skipped_count,
+            "errors": errors,
+            "errors_by_class": dict(errors_by_class),
+            "pages_fetched": found["pages_fetched"],
+            "parse_seconds": round(saved["parse_seconds"], 3),
+            "write_seconds": round(saved["write_seconds"], 3),
+            **latency_percentiles(latencies[requests_before:]),
+            **source.stats(),
+        }
+
+    def search(self, queries, watermarks, full):
+        """Ищет по всем запросам параллельно.
+
+        Запросы пересекаются, поэтому вакансии дедуплицируются по id ещё до
+        догрузки. Для каждого запроса возвращается список найденных id или
+        None, если поиск по нему упал.
+        """
+        source = self.source
+        result = {
+            "items": {},
+            "published": {},
+            "query_ids": [],
+            "errors": [],
+            "error_classes": [],
+            "pages_fetched": 0,
+        }
+
+        with ThreadPoolExecutor(max_workers=source.query_concurrency) as executor:
+            futures = []
+            for params, watermark in zip(queries, watermarks):
+                since = None
+                if watermark.last_published_at and not full:
+                    since = watermark.last_published_at - WATERMARK_OVERLAP
+                futures.append(executor.submit(source.search, params, since))
+
+            for watermark, future in zip(watermarks, futures):
+                try:
+                    items, pages = future.result()
+                except Exception as e:
+                    result["errors"].append(f"Запрос {watermark.query}: {str(e)}")
+                    result["error_classes"].append(type(e).__name__)
+                    result["query_ids"].append(None)
+                    continue
+
+                result["pages_fetched"] += pages
+                ids = []
+                for item in items:
+                    vacancy_id = source.item_id(item)
+                    result["items"][vacancy_id] = item
+                    result["published"][vacancy_id] = source.published_at(item)
+                    ids.append(vacancy_id)
+                result["query_ids"].append(ids)
+
+        return result
+
+    def ingest(self, payloads, fingerprints=None):
+        """Разбирает и записывает (id, payload, error) от адаптера.
+
+        Возвращает число записанных вакансий (и сколько из них вставлено
+        и обновлено), ошибки как (id, exception), множество id, которые не
+        удалось сохранить, и время разбора и записи в секундах.
+        """
+        source = self.source
+        fingerprints = fingerprints if fingerprints is not None else {}
+        if self.archive:
+            payloads = self.archived(payloads, fingerprints)
+
+        def prepare(vacancy_id, record):
+            if fingerprints.get(vacancy_id) is not None:
+                record["fingerprint"] = fingerprints[vacancy_id]
+            return record
+
+        with VacancyBatchWriter(resolvers=self.resolvers) as writer:
+            pipeline = IngestionPipeline(
+                source.mapper,
+                writer,
+                parse_workers=self.parse_workers,
+                prepare=prepare,
+            )
+            pipeline.run(payloads)
+
+        errors = list(pipeline.errors)
+        for platform_vacancy_id, error in writer.errors:
+            errors.append((platform_vacancy_id.removeprefix(source.platform), error))
+        return {
+            "written": writer.written,
+            "inserted": writer.inserted,
+            "updated": writer.updated,
+            "errors": errors,
+            "failed_ids": {vacancy_id for vacancy_id, _ in errors},
+            "parse_seconds": pipeline.parse_seconds,
+            "write_seconds": writer.write_seconds,
+        }
+
+    def archived(self, payloads, fingerprints):
+        for vacancy_id, payload, error in payloads:
+            if not error:
+                try:
+                    self.archive.append(
+                        self.source.platform,
+                        vacancy_id,
+                        payload,
+                        fingerprint=fingerprints.get(vacancy_id),
+                    )
+                except OSError as e:
+                    # архив вспомогательный, загрузку из-за него не прерываем
+                    logger.warning(f"Архив: вакансия {vacancy_id} не сохранена: {e}")
+            yield vacancy_id, payload, error
@@ -0,0 +1,112 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) в секундах
+DEFAULT_TIMEOUT = (5, 15)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+BACKOFF_MAX = 30
+
+_transport = None
+
+
+@contextmanager
+def transport_override(adapter):
+    """Подменяет транспорт всех клиентов, созданных внутри блока,
+    например на ReplayAdapter для бенчмарков без обращения к API."""
+    global _transport
+    previous, _transport = _transport, adapter
+    try:
+        yield adapter
+    finally:
+        _transport = previous
+
+
+class TokenBucket:
+    """Потокобезопасный token bucket: `rate` запросов в секунду, всплеск до
+    `capacity` запросов подряд."""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+
+
+def build_session(headers=None, pool_size=10, retries=MAX_RETRIES):
+    """requests.Session с пулом keep-alive соединений и повторами на 429/5xx.
+
+    urllib3 сам выдерживает паузу из заголовка Retry-After для 429 и 503,
+    иначе ждёт экспоненциально растущий backoff.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=BACKOFF_FACTOR,
+        backoff_max=BACKOFF_MAX,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = _transport or HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # ключи API могут быть не заданы в окружении
+    session.headers.update(
+        {name: value for name, value in (headers or {}).items() if value is not None}
+    )
+    return session
+
+
+class ApiClient:
+    """Общий HTTP-клиент парсеров job-board API."""
+
+    def __init__(self, headers=None, pool_size=10, timeout=DEFAULT_TIMEOUT, bucket=None):
+        self.session = build_session(headers=headers, pool_size=pool_size)
+        self.timeout = timeout
+        self.bucket = bucket
+        # длительность каждого запроса в секундах, включая повторы urllib3,
+        # но без ожидания в token bucket
+        self.latencies = []
+
+    def get(self, url, params=None):
+        if self.bucket:
+            self.bucket.acquire()
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+        return response
+
+    def get_json(self, url, params=None):
+        return self.get(url, params=params).json()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.services.hh.hh_parser.models import Vacancy
+from app.services.ingestion.salary import SALARY_FIELDS, parse_salary_text
+
+
+class Command(BaseCommand):
+    help = "Заполняет структурированные поля зарплаты по текстовому salary"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Пересчитать и уже заполненные вакансии, например после смены курсов",
+        )
+
+    def handle(self, *args, **options):
+        vacancies = Vacancy.objects.exclude(salary__isnull=True).exclude(salary="")
+        if not options["all"]:
+            vacancies = vacancies.filter(
+                salary_from__isnull=True, salary_to__isnull=True
+            )
+        vacancies = vacancies.only("id", "salary").order_by("id")
+
+        last_id, scanned, updated = 0, 0, 0
+        while True:
+            batch = list(vacancies.filter(id__gt=last_id)[: options["batch_size"]])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            scanned += len(batch)
+
+            changed = []
+            for vacancy in batch:
+                fields = parse_salary_text(vacancy.salary)
+                if fields["salary_from"] or fields["salary_to"] or options["all"]:
+                    for field, value in fields.items():
+                        setattr(vacancy, field, value)
+                    changed.append(vacancy)
+            with transaction.atomic():
+                Vacancy.objects.bulk_update(changed, SALARY_FIELDS)
+            updated += len(changed)
+            self.stdout.write(f"Обработано {scanned}, обновлено {updated}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Готово: обновлено {updated} из {scanned} вакансий")
+        )
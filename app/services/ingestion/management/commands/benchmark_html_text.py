@@ -0,0 +1,48 @@
+import timeit
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand
+
+from app.services.ingestion.replay import ReplayCorpus
+from app.services.ingestion.text import html_to_text
+
+
+def beautifulsoup_text(html):
+    return BeautifulSoup(html, "html.parser").get_text()
+
+
+EXTRACTORS = {"beautifulsoup": beautifulsoup_text, "html_to_text": html_to_text}
+
+
+def corpus_descriptions(count):
+    corpus = ReplayCorpus.load(count=count)
+    return [item["description"] for item in corpus.hh_details.values()] + [
+        item["vacancyRichText"] for item in corpus.superjob_objects
+    ]
+
+
+class Command(BaseCommand):
+    help = "Сравнивает извлечение текста описаний вакансий с BeautifulSoup"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Описаний на источник"
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Число прогонов")
+
+    def handle(self, *args, **options):
+        descriptions = corpus_descriptions(options["count"])
+        timings = {}
+        for name, extract in EXTRACTORS.items():
+            runs = timeit.repeat(
+                lambda extract=extract: [extract(html) for html in descriptions],
+                number=1,
+                repeat=options["repeat"],
+            )
+            timings[name] = min(runs)
+            self.stdout.write(
+                f"{name}: {len(descriptions)} описаний за {timings[name]:.3f} с, "
+                f"{len(descriptions) / timings[name]:.0f} опис/с"
+            )
+        speedup = timings["beautifulsoup"] / timings["html_to_text"]
+        self.stdout.write(f"Ускорение: x{speedup:.1f}")
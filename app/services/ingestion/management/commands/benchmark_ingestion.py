@@ -0,0 +1,128 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from app.services.hh.hh_parser.logic.ingestion import sync_hh
+from app.services.ingestion.http import transport_override
+from app.services.ingestion.replay import ReplayAdapter, ReplayCorpus
+from app.services.superjob.superjob_parser.logic.ingestion import sync_superjob
+
+BENCHMARK_PLAN = {"text": "Python", "area": 1}
+
+
+def run_hh():
+    return sync_hh(plans=[BENCHMARK_PLAN], full=True)["saved_count"]
+
+
+def run_superjob():
+    return sync_superjob(full=True)["saved_count"]
+
+
+PIPELINES = {"hh": run_hh, "superjob": run_superjob}
+
+
+class Command(BaseCommand):
+    help = "Замеряет загрузку вакансий на записанном корпусе без обращения к API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source", choices=[*PIPELINES, "all"], default="all", help="Конвейер"
+        )
+        parser.add_argument(
+            "--count", type=int, default=2000, help="Размер корпуса на источник"
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Имитация сетевой задержки на запрос, в секундах",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=10000,
+            help="Лимит запросов в секунду к API на время замера",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            default=0,
+            help="Процессов для разбора ответов API, 0 — разбор в потоке",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Не откатывать записанные вакансии",
+        )
+
+    def handle(self, *args, **options):
+        corpus = ReplayCorpus.load(count=options["count"])
+        sources = PIPELINES if options["source"] == "all" else [options["source"]]
+
+        with override_settings(
+            HH_RATE_LIMIT=options["rate"],
+            SUPERJOB_RATE_LIMIT=options["rate"],
+            INGESTION_PARSE_WORKERS=options["parse_workers"],
+            # синтетический корпус не должен попасть в архив, из которого
+            # reparse восстанавливает вакансии
+            INGESTION_ARCHIVE_ENABLED=False,
+        ):
+            for source in sources:
+                report = self.measure(source, corpus, options)
+                self.stdout.write(self.format_report(source, report))
+
+    def measure(self, source, corpus, options):
+        """Пик памяти снимается отдельным прогоном: трассировка tracemalloc
+        замедляет загрузку в разы, и время прогона с ней не показательно."""
+        peak = self.peak_memory(source, corpus, options)
+        adapter, queries, saved, seconds = self.run(
+            source, corpus, options, keep=options["keep"]
+        )
+
+        return {
+            "saved": saved,
+            "seconds": seconds,
+            "per_second": saved / seconds if seconds else 0.0,
+            "http_requests": adapter.requests,
+            "queries": len(queries),
+            "queries_per_vacancy": len(queries) / saved if saved else 0.0,
+            "peak_mb": peak / 1024 / 1024,
+        }
+
+    def peak_memory(self, source, corpus, options):
+        tracemalloc.start()
+        try:
+            self.run(source, corpus, options)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def run(self, source, corpus, options, keep=False):
+        adapter = ReplayAdapter(corpus, latency=options["latency"])
+        started = time.perf_counter()
+
+        with (
+            transport_override(adapter),
+            CaptureQueriesContext(connection) as queries,
+            transaction.atomic(),
+        ):
+            saved = PIPELINES[source]()
+            if not keep:
+                transaction.set_rollback(True)
+
+        return adapter, queries, saved, time.perf_counter() - started
+
+    @staticmethod
+    def format_report(source, report):
+        return (
+            f"{source}: {report['saved']} вакансий за {report['seconds']:.2f} с, "
+            f"{report['per_second']:.1f} вак/с, "
+            f"HTTP-запросов: {report['http_requests']}, "
+            f"SQL-запросов: {report['queries']} "
+            f"({report['queries_per_vacancy']:.2f} на вакансию), "
+            f"пик памяти: {report['peak_mb']:.1f} МБ"
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app.services.ingestion.dedup import SIMILARITY_THRESHOLD, DuplicateDetector
+
+
+class Command(BaseCommand):
+    help = "Ищет почти-дубликаты среди вакансий, загруженных после прошлого запуска"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=SIMILARITY_THRESHOLD,
+            help="Минимальная оценка похожести по Жаккару",
+        )
+
+    def handle(self, *args, **options):
+        detector = DuplicateDetector(threshold=options["threshold"])
+        detector.run(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Обработано {detector.processed} вакансий, "
+                f"найдено дубликатов: {detector.linked}"
+            )
+        )
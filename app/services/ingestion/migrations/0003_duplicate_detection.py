@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hh_parser', '0006_vacancy_salary_fields'),
+        ('ingestion', '0002_syncwatermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DuplicateCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='VacancySignature',
+            fields=[
+                ('vacancy', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='hh_parser.vacancy')),
+                ('signature', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('cluster', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='signatures', to='ingestion.duplicatecluster')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SignatureBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField(db_index=True)),
+                ('signature', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bands', to='ingestion.vacancysignature')),
+            ],
+        ),
+    ]
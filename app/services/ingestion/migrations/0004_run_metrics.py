@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0003_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='ingestionrun',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='errors_by_class',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='http_p50_ms',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='http_p95_ms',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='http_p99_ms',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='http_requests',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='inserted_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='pages_fetched',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='parse_seconds',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='skipped_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='updated_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='write_seconds',
+            field=models.FloatField(default=0),
+        ),
+    ]
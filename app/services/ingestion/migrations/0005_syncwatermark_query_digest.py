@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:16
+
+import hashlib
+from urllib.parse import unquote_plus
+
+from django.db import migrations, models
+
+
+def digest_query_keys(apps, schema_editor):
+    # прежний query_key — urlencode отсортированных параметров запроса
+    SyncWatermark = apps.get_model('ingestion', 'SyncWatermark')
+    for watermark in SyncWatermark.objects.all():
+        watermark.query = unquote_plus(watermark.query_key)
+        watermark.query_key = hashlib.sha1(watermark.query_key.encode()).hexdigest()
+        watermark.save(update_fields=['query', 'query_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0004_run_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='syncwatermark',
+            name='query',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.RunPython(digest_query_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='syncwatermark',
+            name='query_key',
+            field=models.CharField(max_length=40),
+        ),
+    ]
@@ -0,0 +1,174 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.db import models
+from django.utils import timezone
+
+from ..hh.hh_parser.models import Vacancy
+
+
+class IngestionRun(models.Model):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCESS, "Success"),
+        (FAILED, "Failed"),
+    ]
+
+    # запуск ещё не завершён: новый для того же источника не начинается
+    ACTIVE = [PENDING, RUNNING]
+
+    # ключи результата sync(), которые execute_run переносит в запуск
+    METRIC_FIELDS = [
+        "pages_fetched",
+        "inserted_count",
+        "updated_count",
+        "skipped_count",
+        "http_requests",
+        "http_p50_ms",
+        "http_p95_ms",
+        "http_p99_ms",
+        "parse_seconds",
+        "write_seconds",
+        "errors_by_class",
+    ]
+
+    source = models.CharField(max_length=30)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    saved_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    message = models.TextField(default="", blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    pages_fetched = models.PositiveIntegerField(default=0)
+    inserted_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    http_requests = models.PositiveIntegerField(default=0)
+    http_p50_ms = models.FloatField(null=True, blank=True)
+    http_p95_ms = models.FloatField(null=True, blank=True)
+    http_p99_ms = models.FloatField(null=True, blank=True)
+    parse_seconds = models.FloatField(default=0)
+    write_seconds = models.FloatField(default=0)
+    errors_by_class = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.source} #{self.id} ({self.status})"
+
+    @property
+    def duration_seconds(self):
+        if not (self.started_at and self.finished_at):
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "source": self.source,
+            "status": self.status,
+            "saved_count": self.saved_count,
+            "errors": self.errors,
+            "message": self.message,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": self.duration_seconds,
+            **{field: getattr(self, field) for field in self.METRIC_FIELDS},
+        }
+
+
+class SyncWatermark(models.Model):
+    """Граница загрузки по одному поисковому запросу источника.
+
+    Параметры запроса в urlencode могут быть сколь угодно длинными (буква
+    кириллицы занимает шесть символов), поэтому уникальный ключ —
+    sha1 от них, а сам запрос в читаемом виде хранится в `query`.
+    """
+
+    source = models.CharField(max_length=30)
+    query_key = models.CharField(max_length=40)
+    query = models.TextField(default="", blank=True)
+    last_published_at = models.DateTimeField(null=True, blank=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "query_key"], name="unique_source_query_watermark"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.source}: {self.query}"
+
+    @classmethod
+    def for_query(cls, source, params):
+        params = sorted(params.items())
+        query_key = hashlib.sha1(urlencode(params).encode()).hexdigest()
+        watermark, _ = cls.objects.get_or_create(
+            source=source,
+            query_key=query_key,
+            defaults={"query": "&".join(f"{key}={value}" for key, value in params)},
+        )
+        return watermark
+
+    def advance(self, published_at):
+        if published_at and (
+            self.last_published_at is None or published_at > self.last_published_at
+        ):
+            self.last_published_at = published_at
+        self.last_run_at = timezone.now()
+        self.save(update_fields=["last_published_at", "last_run_at"])
+
+
+class DuplicateCluster(models.Model):
+    """Группа вакансий, которые считаются копиями одной и той же вакансии."""
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Дубликаты #{self.id}"
+
+
+class VacancySignature(models.Model):
+    """MinHash-сигнатура вакансии: массив uint32 в BinaryField."""
+
+    vacancy = models.OneToOneField(
+        Vacancy, related_name="signature", on_delete=models.CASCADE, primary_key=True
+    )
+    signature = models.BinaryField()
+    cluster = models.ForeignKey(
+        DuplicateCluster,
+        related_name="signatures",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Сигнатура вакансии #{self.vacancy_id}"
+
+
+class SignatureBand(models.Model):
+    """LSH-корзина одной полосы сигнатуры; `key` — хеш номера полосы и её
+    значений, поэтому поиск кандидатов — это один индексный lookup."""
+
+    signature = models.ForeignKey(
+        VacancySignature, related_name="bands", on_delete=models.CASCADE
+    )
+    key = models.BigIntegerField(db_index=True)
+
+    def __str__(self):
+        return f"{self.signature_id}: {self.key}"
@@ -0,0 +1,199 @@
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+
+_DONE = object()
+# как часто заблокированная стадия проверяет, не остановлен ли конвейер
+POLL_INTERVAL = 0.1
+
+
+def map_chunk(mapper, chunk):
+    """Разбирает пачку ответов API. Выполняется и в дочерних процессах,
+    поэтому ошибки возвращаются вместе с результатом, а не выбрасываются.
+    Вместе с результатами возвращается время разбора в секундах."""
+    started = time.perf_counter()
+    results = []
+    for key, payload in chunk:
+        try:
+            results.append((key, mapper(payload), None))
+        except Exception as e:
+            results.append((key, None, e))
+    return results, time.perf_counter() - started
+
+
+class IngestionPipeline:
+    """Конвейер fetch → parse → persist.
+
+    Источник отдаёт кортежи (key, payload, error) и читается в отдельном
+    потоке. Разбор `mapper` выполняется в своём потоке либо, если задан
+    `parse_workers`, в ProcessPoolExecutor пачками по `chunk_size`. Запись
+    остаётся в вызывающем потоке: ORM и VacancyBatchWriter не используются
+    из рабочих потоков. Стадии связаны очередями размером `queue_size`,
+    поэтому медленная запись притормаживает загрузку, а не копит ответы
+    в памяти.
+
+    `mapper` должен быть функцией уровня модуля без обращений к БД, чтобы
+    его можно было передать в дочерний процесс. `prepare(key, record)`
+    вызывается перед записью в вызывающем потоке и может дополнить запись.
+
+    В `parse_seconds` суммируется время разбора; при разборе в процессах это
+    сумма по всем процессам, а не время ожидания.
+    """
+
+    def __init__(
+        self,
+        mapper,
+        writer,
+        parse_workers=None,
+        queue_size=None,
+        chunk_size=None,
+        prepare=None,
+    ):
+        self.mapper = mapper
+        self.writer = writer
+        self.prepare = prepare
+        if parse_workers is None:
+            parse_workers = settings.INGESTION_PARSE_WORKERS
+        self.parse_workers = parse_workers
+        self.queue_size = queue_size or settings.INGESTION_QUEUE_SIZE
+        self.chunk_size = chunk_size or settings.INGESTION_PARSE_CHUNK_SIZE
+        self.errors = []
+        self.parse_seconds = 0.0
+        self._failure = None
+        self._stop = threading.Event()
+
+    def run(self, source):
+        """Прогоняет источник через конвейер. Ошибки загрузки и разбора
+        копятся в self.errors как (key, exception), ошибки записи —
+        в writer.errors."""
+        fetched = queue.Queue(maxsize=self.queue_size)
+        parsed = queue.Queue(maxsize=self.queue_size)
+        stages = [
+            threading.Thread(target=self._fetch, args=(source, fetched), daemon=True),
+            threading.Thread(target=self._parse, args=(fetched, parsed), daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+
+        try:
+            self._persist(parsed)
+        finally:
+            self._stop.set()
+            for stage in stages:
+                stage.join()
+
+        if self._failure:
+            raise self._failure
+        return self
+
+    def _put(self, q, entry):
+        while not self._stop.is_set():
+            try:
+                q.put(entry, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fail(self, error):
+        self._failure = self._failure or error
+        self._stop.set()
+
+    def _fetch(self, source, fetched):
+        try:
+            for entry in source:
+                if not self._put(fetched, entry):
+                    return
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(fetched, _DONE)
+
+    def _parse(self, fetched, parsed):
+        try:
+            if self.parse_workers:
+                self._parse_in_processes(fetched, parsed)
+            else:
+                for chunk in self._chunks(fetched, parsed):
+                    self._emit(parsed, map_chunk(self.mapper, chunk))
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(parsed, _DONE)
+
+    def _parse_in_processes(self, fetched, parsed):
+        # spawn: форк процесса с открытыми соединениями и потоками небезопасен,
+        # а дочерним процессам нужен настроенный Django, чтобы импортировать mapper
+        with ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as executor:
+            pending = deque()
+            for chunk in self._chunks(fetched, parsed):
+                pending.append(executor.submit(map_chunk, self.mapper, chunk))
+                # не больше двух пачек на процесс, чтобы очередь оставалась
+                # ограниченной и на стороне пула
+                if len(pending) >= self.parse_workers * 2:
+                    self._emit(parsed, pending.popleft().result())
+            while pending:
+                self._emit(parsed, pending.popleft().result())
+
+    def _chunks(self, fetched, parsed):
+        """Собирает из очереди пачки для разбора; ответы с ошибкой загрузки
+        сразу передаются дальше."""
+        while True:
+            entry = self._get(fetched)
+            if entry is _DONE:
+                return
+            chunk = []
+            while entry is not _DONE:
+                key, payload, error = entry
+                if error:
+                    self._put(parsed, entry)
+                else:
+                    chunk.append((key, payload))
+                if len(chunk) >= self.chunk_size:
+                    break
+                try:
+                    entry = fetched.get_nowait()
+                except queue.Empty:
+                    break
+            if chunk:
+                yield chunk
+            if entry is _DONE:
+                return
+
+    def _emit(self, parsed, chunk_result):
+        results, seconds = chunk_result
+        self.parse_seconds += seconds
+        for result in results:
+            if not self._put(parsed, result):
+                return
+
+    def _persist(self, parsed):
+        while True:
+            entry = self._get(parsed)
+            if entry is _DONE:
+                return
+            key, record, error = entry
+            if error:
+                self.errors.append((key, error))
+                continue
+            if self.prepare:
+                record = self.prepare(key, record)
+            self.writer.add(record)
@@ -0,0 +1,202 @@
+import copy
+import json
+import math
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from django.utils import timezone
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ..hh.hh_parser.logic.search import HH_MAX_DEPTH
+from ..superjob.superjob_parser.logic.ingestion import SUPERJOB_MAX_DEPTH
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+HH_DETAIL_PATH = re.compile(r"^/vacancies/(?P<id>\d+)$")
+# поля детальной карточки HH, которые есть и в поисковой выдаче
+HH_LIST_FIELDS = (
+    "id",
+    "name",
+    "area",
+    "salary",
+    "address",
+    "employer",
+    "schedule",
+    "experience",
+    "employment",
+    "archived",
+    "alternate_url",
+    "published_at",
+    "created_at",
+)
+
+
+def list_item(detail):
+    return {field: detail.get(field) for field in HH_LIST_FIELDS}
+
+
+def load_fixture(name):
+    with open(FIXTURES_DIR / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class ReplayCorpus:
+    """Корпус ответов HH и SuperJob для воспроизведения без сети.
+
+    Записанные карточки из fixtures/ размножаются до нужного объёма: у копий
+    свои id, ссылки, даты публикации и немного отличающиеся зарплаты и
+    описания, так что маппинг и запись в БД работают как на живых данных.
+    """
+
+    def __init__(self, hh_details, superjob_objects):
+        self.hh_details = {item["id"]: item for item in hh_details}
+        self.hh_items = sorted(
+            [list_item(item) for item in hh_details],
+            key=lambda item: item["published_at"],
+            reverse=True,
+        )
+        self.superjob_objects = sorted(
+            superjob_objects, key=lambda item: item["date_published"], reverse=True
+        )
+
+    @classmethod
+    def load(cls, count=None, now=None):
+        hh_seeds = load_fixture("hh_details.json")
+        superjob_seeds = load_fixture("superjob_objects.json")
+        if not count:
+            return cls(hh_seeds, superjob_seeds)
+        now = now or timezone.now()
+        return cls(
+            expand_hh(hh_seeds, count, now), expand_superjob(superjob_seeds, count, now)
+        )
+
+
+def expand_hh(seeds, count, now):
+    details = []
+    for i in range(count):
+        item = copy.deepcopy(seeds[i % len(seeds)])
+        vacancy_id = str(100_000_000 + i)
+        published_at = (now - timedelta(minutes=7 * i)).strftime("%Y-%m-%dT%H:%M:%S%z")
+        item.update(
+            id=vacancy_id,
+            name=f"{item['name']} #{i}",
+            alternate_url=f"https://hh.ru/vacancy/{vacancy_id}",
+            published_at=published_at,
+            created_at=published_at,
+            description=f"{item['description']}<p>Команда №{i % 97}</p>",
+        )
+        if item["salary"] and item["salary"]["from"]:
+            item["salary"]["from"] += (i % 50) * 1000
+        details.append(item)
+    return details
+
+
+def expand_superjob(seeds, count, now):
+    objects = []
+    for i in range(count):
+        item = copy.deepcopy(seeds[i % len(seeds)])
+        vacancy_id = 60_000_000 + i
+        item.update(
+            id=vacancy_id,
+            profession=f"{item['profession']} #{i}",
+            link=f"https://www.superjob.ru/vakansii/{vacancy_id}.html",
+            date_published=int((now - timedelta(minutes=7 * i)).timestamp()),
+            vacancyRichText=f"{item['vacancyRichText']}<p>Команда №{i % 97}</p>",
+        )
+        if item["payment_from"]:
+            item["payment_from"] += (i % 50) * 1000
+        objects.append(item)
+    return objects
+
+
+class ReplayAdapter(BaseAdapter):
+    """Транспорт requests, отвечающий из ReplayCorpus вместо api.hh.ru и
+    api.superjob.ru. `latency` имитирует сетевую задержку на запрос."""
+
+    def __init__(self, corpus, latency=0.0):
+        super().__init__()
+        self.corpus = corpus
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(request.url)
+        params = dict(parse_qsl(url.query))
+        if url.netloc == "api.hh.ru":
+            status, payload = self.hh(url.path, params)
+        elif url.netloc == "api.superjob.ru":
+            status, payload = self.superjob(params)
+        else:
+            status, payload = 404, {"error": "not recorded"}
+        return self.build_response(request, status, payload)
+
+    def close(self):
+        pass
+
+    def hh(self, path, params):
+        match = HH_DETAIL_PATH.match(path)
+        if match:
+            item = self.corpus.hh_details.get(match["id"])
+            return (200, item) if item else (404, {"errors": [{"type": "not_found"}]})
+
+        items = self.corpus.hh_items
+        if "date_from" in params:
+            date_from = datetime.fromisoformat(params["date_from"])
+            items = [i for i in items if parse_hh_date(i["published_at"]) >= date_from]
+        if "date_to" in params:
+            date_to = datetime.fromisoformat(params["date_to"])
+            items = [i for i in items if parse_hh_date(i["published_at"]) <= date_to]
+
+        page, per_page = int(params.get("page", 0)), int(params.get("per_page", 20))
+        if (page + 1) * per_page > HH_MAX_DEPTH:
+            return 400, {"errors": [{"type": "bad_argument", "value": "page"}]}
+        return 200, {
+            "found": len(items),
+            "pages": math.ceil(len(items) / per_page),
+            "page": page,
+            "per_page": per_page,
+            "items": items[page * per_page : (page + 1) * per_page],
+        }
+
+    def superjob(self, params):
+        objects = self.corpus.superjob_objects
+        if "date_published_from" in params:
+            date_from = int(params["date_published_from"])
+            objects = [i for i in objects if i["date_published"] >= date_from]
+        if "date_published_to" in params:
+            date_to = int(params["date_published_to"])
+            objects = [i for i in objects if i["date_published"] <= date_to]
+
+        page, count = int(params.get("page", 0)), int(params.get("count", 20))
+        visible = objects[:SUPERJOB_MAX_DEPTH]
+        return 200, {
+            "objects": visible[page * count : (page + 1) * count],
+            "total": len(objects),
+            "more": (page + 1) * count < len(visible),
+        }
+
+    @staticmethod
+    def build_response(request, status, payload):
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = json.dumps(payload, ensure_ascii=False).encode()
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def parse_hh_date(value):
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
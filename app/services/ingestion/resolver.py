@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from ..hh.hh_parser.models import City, Company, Platform
+
+DIMENSIONS = {"platform": Platform, "company": Company, "city": City}
+LOOKUP_CHUNK = 500
+
+_shared_resolvers = {}
+_shared_lock = threading.Lock()
+
+
+class NameResolver:
+    """Кэш name -> id для справочников Platform, Company и City.
+
+    При создании подгружает существующие записи, а неизвестные имена
+    создаёт одним bulk_create на пачку. `max_size` ограничивает кэш по LRU.
+    Имена длиннее поля name обрезаются до его max_length, иначе вставка
+    справочника падала бы на всю пачку; результат resolve_many всё равно
+    отдаётся по исходным именам.
+    """
+
+    def __init__(self, model, max_size=None):
+        self.model = model
+        self.max_size = max_size
+        self.max_length = model._meta.get_field("name").max_length
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.preload()
+
+    def preload(self):
+        queryset = self.model.objects.order_by("-id").values_list("name", "id")
+        if self.max_size:
+            queryset = queryset[: self.max_size]
+        # при дублях имён побеждает самая ранняя запись
+        for name, pk in queryset:
+            self.cache[name] = pk
+
+    def resolve(self, name):
+        return self.resolve_many([name]).get(name)
+
+    def resolve_many(self, names):
+        stored = {name: self._stored_name(name) for name in names if name}
+        with self.lock:
+            missing = {name for name in stored.values() if name not in self.cache}
+            if missing:
+                self._load(list(missing))
+            result = {}
+            for name, stored_name in stored.items():
+                self.cache.move_to_end(stored_name)
+                result[name] = self.cache[stored_name]
+            self._evict()
+            return result
+
+    def _stored_name(self, name):
+        if self.max_length and len(name) > self.max_length:
+            return name[: self.max_length]
+        return name
+
+    def _load(self, names):
+        found = self._lookup(names)
+        unseen = [name for name in names if name not in found]
+        if unseen:
+            # имена уникальны: то, что успел создать параллельный запуск,
+            # пропускается и подхватывается повторным поиском
+            self.model.objects.bulk_create(
+                [self.model(name=name) for name in unseen], ignore_conflicts=True
+            )
+            found.update(self._lookup(unseen))
+        self.cache.update(found)
+
+    def _lookup(self, names):
+        found = {}
+        for start in range(0, len(names), LOOKUP_CHUNK):
+            chunk = names[start : start + LOOKUP_CHUNK]
+            rows = (
+                self.model.objects.filter(name__in=chunk)
+                .order_by("-id")
+                .values_list("name", "id")
+            )
+            found.update(rows)
+        return found
+
+    def _evict(self):
+        if self.max_size:
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+
+def get_resolvers():
+    """Резолверы на один запуск или общие на процесс, если включён
+    INGESTION_SHARED_DIMENSION_CACHE."""
+    max_size = settings.INGESTION_DIMENSION_CACHE_SIZE
+    if not settings.INGESTION_SHARED_DIMENSION_CACHE:
+        return {
+            field: NameResolver(model, max_size) for field, model in DIMENSIONS.items()
+        }
+
+    with _shared_lock:
+        for field, model in DIMENSIONS.items():
+            if field not in _shared_resolvers:
+                _shared_resolvers[field] = NameResolver(model, max_size)
+        return dict(_shared_resolvers)
@@ -0,0 +1,97 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import IngestionRun
+
+logger = logging.getLogger(__name__)
+
+
+def execute_run(run, sync, **options):
+    """Выполняет `sync(**options)` и фиксирует результат в IngestionRun.
+
+    `sync` должен вернуть словарь с ключами `saved_count` и `errors`;
+    ключи из IngestionRun.METRIC_FIELDS, если они есть, тоже сохраняются.
+    """
+    run.status = IngestionRun.RUNNING
+    run.started_at = timezone.now()
+    run.save(update_fields=["status", "started_at"])
+
+    try:
+        result = sync(**options)
+    except Exception as e:
+        logger.exception(f"{run.source}: запуск #{run.id} завершился ошибкой")
+        run.status = IngestionRun.FAILED
+        run.message = f"Ошибка при парсинге: {str(e)}"
+    else:
+        run.status = IngestionRun.SUCCESS
+        run.saved_count = result["saved_count"]
+        run.errors = result["errors"]
+        for field in IngestionRun.METRIC_FIELDS:
+            if field in result:
+                setattr(run, field, result[field])
+        run.message = f"Успешно сохранено {run.saved_count} вакансий"
+
+    run.finished_at = timezone.now()
+    run.save()
+    return run
+
+
+def expire_stale_runs(source):
+    """Помечает FAILED запуски источника, которые дольше
+    INGESTION_RUN_TIMEOUT числятся RUNNING: процесс, выполнявший их,
+    завершился, не записав результат."""
+    now = timezone.now()
+    return IngestionRun.objects.filter(
+        source=source,
+        status=IngestionRun.RUNNING,
+        started_at__lt=now - timedelta(seconds=settings.INGESTION_RUN_TIMEOUT),
+    ).update(
+        status=IngestionRun.FAILED,
+        finished_at=now,
+        message="Запуск прерван: результат не записан до истечения таймаута",
+    )
+
+
+def active_run(source):
+    """Незавершённый запуск источника — ожидающий или выполняющийся."""
+    expire_stale_runs(source)
+    return (
+        IngestionRun.objects.filter(source=source, status__in=IngestionRun.ACTIVE)
+        .order_by("id")
+        .first()
+    )
+
+
+def request_run(source):
+    """Ставит запуск источника в очередь; выполняют его sync_hh и
+    sync_superjob. Возвращает (run, created): пока у источника есть
+    незавершённый запуск, новый не создаётся и возвращается он."""
+    with transaction.atomic():
+        run = active_run(source)
+        if run is not None:
+            return run, False
+        return IngestionRun.objects.create(source=source), True
+
+
+def claim_run(source):
+    """Запуск для management-команды: самый ранний PENDING-запуск
+    источника, поставленный через API, или новый. None, если у источника
+    уже выполняется запуск."""
+    with transaction.atomic():
+        expire_stale_runs(source)
+        runs = IngestionRun.objects.select_for_update().filter(
+            source=source, status__in=IngestionRun.ACTIVE
+        )
+        if any(run.status == IngestionRun.RUNNING for run in runs):
+            return None
+        run = min(runs, key=lambda run: run.id, default=None)
+        if run is None:
+            run = IngestionRun(source=source)
+        run.status = IngestionRun.RUNNING
+        run.started_at = timezone.now()
+        run.save()
+        return run
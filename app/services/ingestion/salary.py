@@ -0,0 +1,134 @@
+import json
+import re
+from functools import cache
+
+from django.conf import settings
+
+# налог, который вычитается из зарплаты, указанной до вычета (gross)
+NDFL_RATE = 0.13
+# устаревшие и нестандартные коды валют из API и текстов вакансий
+CURRENCY_ALIASES = {"RUR": "RUB", "BYR": "BYN"}
+CURRENCY_PATTERNS = [
+    ("RUB", re.compile(r"₽|руб|\brub\b|\brur\b|\bр\.")),
+    ("USD", re.compile(r"\$|\busd\b|долл")),
+    ("EUR", re.compile(r"€|\beur\b|евро")),
+    ("KZT", re.compile(r"₸|\bkzt\b|тенге")),
+]
+GROSS_PATTERN = re.compile(r"до вычета|до уплаты|\bgross\b|гросс")
+NET_PATTERN = re.compile(r"на руки|после вычета|\bnet\b|нетто")
+# сумма — разряды по три цифры через пробел, точку или запятую либо цифры
+# подряд; соседние числа («+7 999 123 45 67», «150 000, 5/2») не склеиваются
+AMOUNT_PATTERN = re.compile(
+    r"(?<![\d.,])(?P<number>\d{1,3}(?:[ \u00a0\u202f.,]\d{3})+|\d+)"
+    r"(?:[.,](?P<fraction>\d{1,2}))?(?![ \u00a0\u202f.,]?\d)"
+    r"(?:\s*(?P<thousands>k|к|тыс(?:яч[аи]?|\.)?)(?![a-zа-я]))?"
+)
+UPTO_PATTERN = re.compile(r"\bдо\s*$")
+# меньшие числа в строке о зарплате — проценты, сроки и т.п.
+MIN_AMOUNT = 100
+# большие — телефоны и прочие цифры; заодно сумма в рублях по курсу
+# остаётся в пределах PositiveIntegerField
+MAX_AMOUNT = 10_000_000
+SALARY_FIELDS = (
+    "salary_from",
+    "salary_to",
+    "salary_currency",
+    "salary_gross",
+    "salary_rub_monthly",
+)
+
+
+@cache
+def currency_rates():
+    """Курсы валют к рублю из INGESTION_CURRENCY_RATES_FILE."""
+    with open(settings.INGESTION_CURRENCY_RATES_FILE, encoding="utf-8") as f:
+        return json.load(f)["rates"]
+
+
+def normalize_currency(code):
+    if not code:
+        return ""
+    code = code.upper()
+    return CURRENCY_ALIASES.get(code, code)
+
+
+def rub_monthly(salary_from, salary_to, currency, gross=None):
+    """Середина вилки в рублях на руки; None, если сумм нет или курс
+    валюты неизвестен."""
+    amounts = [amount for amount in (salary_from, salary_to) if amount]
+    rate = currency_rates().get(currency)
+    if not amounts or rate is None:
+        return None
+    value = sum(amounts) / len(amounts) * rate
+    if gross:
+        value *= 1 - NDFL_RATE
+    return round(value)
+
+
+def salary_fields(salary_from=None, salary_to=None, currency=None, gross=None):
+    """Структурированные поля зарплаты Vacancy из суммы вилки и валюты."""
+    salary_from = salary_from or None
+    salary_to = salary_to or None
+    currency = normalize_currency(currency) if salary_from or salary_to else ""
+    return {
+        "salary_from": salary_from,
+        "salary_to": salary_to,
+        "salary_currency": currency,
+        "salary_gross": gross,
+        "salary_rub_monthly": rub_monthly(salary_from, salary_to, currency, gross),
+    }
+
+
+def parse_amounts(text):
+    """Суммы из строки как (сумма, стоит ли перед ней «до»). Множитель
+    «тыс»/«k» в конце вилки вроде «120-180 тыс.» относится к обоим концам."""
+    amounts = []
+    for match in AMOUNT_PATTERN.finditer(text):
+        number = int(re.sub(r"\D", "", match["number"]))
+        if match["thousands"]:
+            fraction = f"0.{match['fraction']}" if match["fraction"] else 0
+            amount = round((number + float(fraction)) * 1000)
+        else:
+            amount = number
+        upto = bool(UPTO_PATTERN.search(text[: match.start()]))
+        amounts.append([amount, bool(match["thousands"]), upto])
+
+    for previous, current in zip(amounts, amounts[1:]):
+        if current[1] and not previous[1] and previous[0] < 1000:
+            previous[0] *= 1000
+    return [
+        (amount, upto)
+        for amount, _, upto in amounts
+        if MIN_AMOUNT <= amount <= MAX_AMOUNT
+    ]
+
+
+def parse_salary_text(text, default_currency="RUB"):
+    """Разбирает зарплату из строки вроде «от 150 000 до 200 000 руб. на руки»
+    или «от 150000 до 250000 RUR». Возвращает поля salary_fields; если в
+    строке нет сумм, все поля пустые."""
+    if not text:
+        return salary_fields()
+    text = text.lower()
+
+    amounts = parse_amounts(text)
+    if not amounts:
+        return salary_fields()
+
+    if len(amounts) > 1:
+        salary_from, salary_to = amounts[0][0], amounts[1][0]
+    elif amounts[0][1]:
+        salary_from, salary_to = None, amounts[0][0]
+    else:
+        salary_from, salary_to = amounts[0][0], None
+
+    currency = next(
+        (code for code, pattern in CURRENCY_PATTERNS if pattern.search(text)),
+        default_currency,
+    )
+    gross = None
+    if GROSS_PATTERN.search(text):
+        gross = True
+    elif NET_PATTERN.search(text):
+        gross = False
+    return salary_fields(salary_from, salary_to, currency, gross)
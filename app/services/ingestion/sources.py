@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+
+def fingerprint(values):
+    """sha1 от JSON-представления значений, которыми определяется вакансия."""
+    payload = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class VacancySource:
+    """Адаптер площадки для IngestionEngine.
+
+    Адаптер знает только API своей площадки: как искать по запросу, как
+    догрузить полные данные и как превратить ответ в словарь полей Vacancy.
+    Параллельность, дедупликация, пропуск неизменившихся вакансий, запись
+    пачками, watermark и учёт ошибок реализованы один раз в движке.
+
+    `mapper` — функция уровня модуля без обращений к БД, объявленная как
+    staticmethod: движок может выполнять её в дочерних процессах. Она
+    возвращает словарь полей Vacancy, где platform, company и city указаны
+    именами.
+    """
+
+    # Platform.name площадки, он же префикс platform_vacancy_id
+    platform = None
+    mapper = None
+    # сколько поисковых запросов выполнять параллельно
+    query_concurrency = 1
+    # ApiClient площадки; по его latencies движок считает перцентили
+    client = None
+
+    def default_queries(self):
+        """Запросы, которые выполняются, если движку не передали свои."""
+        return []
+
+    def search(self, params, since=None):
+        """Выполняет поиск по запросу начиная с даты публикации `since`.
+
+        Возвращает пару (элементы выдачи, число запрошенных страниц).
+        """
+        raise NotImplementedError
+
+    def item_id(self, item):
+        return str(item["id"])
+
+    def published_at(self, item):
+        """Дата публикации элемента выдачи как aware datetime."""
+        raise NotImplementedError
+
+    def fingerprint(self, item):
+        """Отпечаток элемента выдачи. Если он совпадает с сохранённым,
+        вакансия не загружается и не записывается повторно; None отключает
+        эту проверку."""
+        return None
+
+    def fetch(self, items):
+        """Отдаёт (id, payload, error) для каждой вакансии, которую нужно
+        сохранить. По умолчанию выдача уже содержит все нужные поля."""
+        for item in items:
+            yield self.item_id(item), item, None
+
+    def replay(self, payloads):
+        """Подготавливает (id, payload, error) из RawArchive к повторному
+        разбору. Нужно, если mapper получает не сам сырой ответ."""
+        return payloads
+
+    def stats(self):
+        """Дополнительные метрики адаптера для результата запуска."""
+        return {}
@@ -0,0 +1,739 @@
+import json
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from app.services.hh.hh_parser.models import City, Company, Platform, Vacancy
+from app.services.ingestion.archive import RawArchive
+from app.services.ingestion.dedup import DuplicateDetector, minhash, shingles, similarity
+from app.services.ingestion.engine import IngestionEngine, latency_percentiles
+from app.services.ingestion.http import ApiClient, TokenBucket, transport_override
+from app.services.ingestion.models import IngestionRun, SyncWatermark
+from app.services.ingestion.pipeline import IngestionPipeline
+from app.services.ingestion.replay import ReplayAdapter, ReplayCorpus
+from app.services.ingestion.resolver import NameResolver
+from app.services.ingestion.runs import claim_run, execute_run, request_run
+from app.services.ingestion.salary import parse_salary_text, salary_fields
+from app.services.ingestion.sources import VacancySource, fingerprint
+from app.services.ingestion.text import html_to_text
+from app.services.ingestion.writer import VacancyBatchWriter
+from app.services.superjob.superjob_parser.logic.ingestion import sync_superjob
+
+
+class ExecuteRunTests(TestCase):
+    def test_success_is_recorded(self):
+        run = IngestionRun.objects.create(source="HeadHunter")
+
+        execute_run(
+            run,
+            lambda: {
+                "saved_count": 3,
+                "updated_count": 1,
+                "http_p95_ms": 120.5,
+                "errors": ["Вакансия 1: boom"],
+            },
+        )
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, IngestionRun.SUCCESS)
+        self.assertEqual(run.saved_count, 3)
+        self.assertEqual(run.updated_count, 1)
+        self.assertEqual(run.http_p95_ms, 120.5)
+        self.assertEqual(run.errors, ["Вакансия 1: boom"])
+        self.assertIsNotNone(run.started_at)
+        self.assertIsNotNone(run.finished_at)
+
+    def test_failure_is_recorded(self):
+        run = IngestionRun.objects.create(source="HeadHunter")
+
+        def sync():
+            raise RuntimeError("HH недоступен")
+
+        execute_run(run, sync)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, IngestionRun.FAILED)
+        self.assertIn("HH недоступен", run.message)
+
+
+class RunQueueTests(TestCase):
+    def test_command_claims_queued_run(self):
+        queued, created = request_run("SuperJob")
+        self.assertTrue(created)
+
+        run = claim_run("SuperJob")
+
+        self.assertEqual(run.id, queued.id)
+        self.assertEqual(run.status, IngestionRun.RUNNING)
+        self.assertEqual(request_run("SuperJob"), (run, False))
+        self.assertIsNone(claim_run("SuperJob"))
+        self.assertIsNotNone(claim_run("HeadHunter"))
+
+    @override_settings(INGESTION_RUN_TIMEOUT=60)
+    def test_stale_running_run_is_failed(self):
+        stale = IngestionRun.objects.create(
+            source="SuperJob",
+            status=IngestionRun.RUNNING,
+            started_at=datetime.now(timezone.utc) - timedelta(minutes=2),
+        )
+
+        run = claim_run("SuperJob")
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, IngestionRun.FAILED)
+        self.assertIsNotNone(stale.finished_at)
+        self.assertNotEqual(run.id, stale.id)
+
+
+class SyncWatermarkTests(TestCase):
+    def test_long_cyrillic_query_gets_fixed_length_key(self):
+        params = {
+            "text": "Ведущий разработчик информационных систем здравоохранения РФ",
+            "area": 1,
+            "schedule": "remote",
+            "professional_role": 96,
+        }
+
+        watermark = SyncWatermark.for_query("HeadHunter", params)
+
+        self.assertEqual(len(watermark.query_key), 40)
+        self.assertIn("text=Ведущий разработчик", watermark.query)
+        self.assertEqual(
+            SyncWatermark.for_query("HeadHunter", dict(reversed(params.items()))),
+            watermark,
+        )
+        self.assertNotEqual(SyncWatermark.for_query("SuperJob", params), watermark)
+
+
+class RunDetailViewTests(TestCase):
+    def test_returns_run_state(self):
+        run = IngestionRun.objects.create(source="SuperJob")
+        resp = self.client.get(reverse("ingestion_run_detail", args=[run.id]))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["status"], IngestionRun.PENDING)
+
+    def test_lists_runs_with_metrics(self):
+        IngestionRun.objects.create(source="HeadHunter")
+        IngestionRun.objects.create(
+            source="SuperJob", inserted_count=5, errors_by_class={"HTTPError": 2}
+        )
+        resp = self.client.get(reverse("ingestion_run_list"), {"source": "SuperJob"})
+        runs = resp.json()["runs"]
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0]["inserted_count"], 5)
+        self.assertEqual(runs[0]["errors_by_class"], {"HTTPError": 2})
+
+    def test_unknown_run_is_404(self):
+        resp = self.client.get(reverse("ingestion_run_detail", args=[999]))
+        self.assertEqual(resp.status_code, 404)
+
+
+class VacancyBatchWriterTests(TestCase):
+    def record(self, platform_vacancy_id, **overrides):
+        return {
+            "platform_vacancy_id": platform_vacancy_id,
+            "title": f"Вакансия {platform_vacancy_id}",
+            "url": f"https://example.com/{platform_vacancy_id}",
+            "published_at": datetime(2025, 6, 30, tzinfo=timezone.utc),
+            **overrides,
+        }
+
+    def test_flushes_in_chunks_and_upserts(self):
+        with VacancyBatchWriter(chunk_size=2) as writer:
+            for i in range(5):
+                writer.add(self.record(f"HeadHunter{i}"))
+            self.assertEqual(writer.written, 4)
+
+        self.assertEqual(writer.written, 5)
+        self.assertEqual(Vacancy.objects.count(), 5)
+
+        with VacancyBatchWriter() as writer:
+            writer.add(self.record("HeadHunter1", title="Senior Python"))
+
+        self.assertEqual(Vacancy.objects.count(), 5)
+        self.assertEqual(
+            Vacancy.objects.get(platform_vacancy_id="HeadHunter1").title, "Senior Python"
+        )
+
+    def test_duplicate_keys_in_one_batch_are_collapsed(self):
+        with VacancyBatchWriter() as writer:
+            writer.add(self.record("SuperJob1", title="old"))
+            writer.add(self.record("SuperJob1", title="new"))
+
+        self.assertEqual(writer.written, 1)
+        self.assertEqual(Vacancy.objects.get().title, "new")
+
+    def test_changed_vacancy_loses_duplicate_signature(self):
+        with VacancyBatchWriter() as writer:
+            writer.add(self.record("HeadHunter1", fingerprint="a"))
+            writer.add(self.record("HeadHunter2", fingerprint="a"))
+        DuplicateDetector().run()
+
+        with VacancyBatchWriter() as writer:
+            writer.add(self.record("HeadHunter1", title="Senior", fingerprint="b"))
+            writer.add(self.record("HeadHunter2", fingerprint="a"))
+
+        self.assertEqual(
+            list(
+                DuplicateDetector()
+                .pending()
+                .values_list("platform_vacancy_id", flat=True)
+            ),
+            ["HeadHunter1"],
+        )
+
+    def test_broken_row_does_not_lose_the_batch(self):
+        with VacancyBatchWriter() as writer:
+            writer.add(self.record("SuperJob1"))
+            writer.add(self.record("SuperJob2", title=None))
+            writer.add(self.record("SuperJob3"))
+
+        self.assertEqual(writer.written, 2)
+        self.assertEqual([key for key, _ in writer.errors], ["SuperJob2"])
+        self.assertEqual(Vacancy.objects.count(), 2)
+
+
+class NameResolverTests(TestCase):
+    def test_preloads_existing_and_bulk_creates_unseen(self):
+        yandex = Company.objects.create(name="Яндекс")
+        resolver = NameResolver(Company)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.resolve("Яндекс"), yandex.id)
+
+        # один SELECT, один INSERT и один SELECT для id новых записей
+        with self.assertNumQueries(3):
+            ids = resolver.resolve_many(["Ozon", "Авито", "Яндекс", None])
+
+        self.assertEqual(set(ids), {"Ozon", "Авито", "Яндекс"})
+        self.assertEqual(Company.objects.count(), 3)
+
+        with self.assertNumQueries(0):
+            resolver.resolve_many(["Ozon", "Авито"])
+
+    def test_cache_is_lru_bounded(self):
+        resolver = NameResolver(City, max_size=2)
+        resolver.resolve_many(["Москва"])
+        resolver.resolve_many(["Тула"])
+        resolver.resolve_many(["Москва"])
+        resolver.resolve_many(["Казань"])
+
+        self.assertEqual(list(resolver.cache), ["Москва", "Казань"])
+        self.assertEqual(resolver.resolve("Тула"), City.objects.get(name="Тула").id)
+
+    def test_long_names_are_truncated_to_field_length(self):
+        resolver = NameResolver(City)
+        long_name = "Санкт-Петербург" * 5
+        ids = resolver.resolve_many([long_name, long_name + " и область"])
+
+        city = City.objects.get()
+        self.assertEqual(city.name, long_name[:50])
+        self.assertEqual(ids, {long_name: city.id, long_name + " и область": city.id})
+
+    def test_writer_resolves_dimension_names(self):
+        with VacancyBatchWriter() as writer:
+            for i in range(3):
+                writer.add(
+                    {
+                        "platform_vacancy_id": f"SuperJob{i}",
+                        "title": "Python",
+                        "url": f"https://example.com/{i}",
+                        "published_at": datetime(2025, 6, 30, tzinfo=timezone.utc),
+                        "platform": Platform.SUPER_JOB,
+                        "company": "Яндекс",
+                        "city": "Москва",
+                    }
+                )
+
+        self.assertEqual(Company.objects.count(), 1)
+        self.assertEqual(City.objects.count(), 1)
+        self.assertEqual(
+            set(Vacancy.objects.values_list("platform__name", flat=True)),
+            {Platform.SUPER_JOB},
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_burst_then_waits_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(clock.now, 0.0)
+
+        bucket.acquire()
+        self.assertAlmostEqual(clock.now, 0.5)
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    responses = []
+
+    def do_GET(self):
+        status, headers = self.responses.pop(0)
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ApiClientTests(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/vacancies"
+        self.client = ApiClient()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries_429_honoring_retry_after(self):
+        FlakyHandler.responses = [(429, {"Retry-After": "1"}), (200, {})]
+
+        started = time.monotonic()
+        data = self.client.get_json(self.url, params={"page": 1})
+
+        self.assertEqual(data, {"path": "/vacancies?page=1"})
+        self.assertGreaterEqual(time.monotonic() - started, 1)
+        self.assertEqual(FlakyHandler.responses, [])
+
+    def test_gives_up_after_max_retries(self):
+        FlakyHandler.responses = [(503, {})] * 6
+
+        with patch("app.services.ingestion.http.BACKOFF_FACTOR", 0):
+            client = ApiClient()
+        with self.assertRaises(requests.HTTPError):
+            client.get_json(self.url)
+        self.assertEqual(FlakyHandler.responses, [])
+
+
+class ReplayAdapterTests(SimpleTestCase):
+    def setUp(self):
+        self.corpus = ReplayCorpus.load(
+            count=250, now=datetime(2025, 7, 1, tzinfo=timezone.utc)
+        )
+        self.adapter = ReplayAdapter(self.corpus)
+
+    def test_hh_search_pages_and_detail(self):
+        with transport_override(self.adapter):
+            client = ApiClient()
+            page = client.get_json(
+                "https://api.hh.ru/vacancies", {"page": 2, "per_page": 100}
+            )
+            detail = client.get_json("https://api.hh.ru/vacancies/100000007")
+
+        self.assertEqual(page["found"], 250)
+        self.assertEqual(page["pages"], 3)
+        self.assertEqual(len(page["items"]), 50)
+        self.assertNotIn("description", page["items"][0])
+        self.assertEqual(detail["alternate_url"], "https://hh.ru/vacancy/100000007")
+        self.assertEqual(self.adapter.requests, 2)
+
+    def test_hh_depth_limit_and_missing_detail(self):
+        with transport_override(self.adapter):
+            client = ApiClient()
+            with self.assertRaises(requests.HTTPError):
+                client.get("https://api.hh.ru/vacancies", {"page": 20, "per_page": 100})
+            with self.assertRaises(requests.HTTPError):
+                client.get("https://api.hh.ru/vacancies/1")
+
+    def test_superjob_pages_until_more_is_false(self):
+        with transport_override(self.adapter):
+            client = ApiClient()
+            last = client.get_json(
+                "https://api.superjob.ru/2.0/vacancies/", {"page": 2, "count": 100}
+            )
+
+        self.assertEqual(len(last["objects"]), 50)
+        self.assertFalse(last["more"])
+
+
+class BenchmarkIngestionCommandTests(TestCase):
+    def test_reports_and_rolls_back(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        out = StringIO()
+
+        with override_settings(
+            INGESTION_ARCHIVE_ENABLED=True, INGESTION_ARCHIVE_DIR=tmp.name
+        ):
+            call_command("benchmark_ingestion", source="hh", count=30, stdout=out)
+
+        self.assertIn("hh: 30 вакансий", out.getvalue())
+        self.assertFalse(Vacancy.objects.exists())
+        self.assertEqual(list(Path(tmp.name).iterdir()), [])
+
+
+class HtmlToTextTests(SimpleTestCase):
+    def test_paragraphs_and_list_items_become_lines(self):
+        html = (
+            "<p><strong>Задачи:</strong></p><ul><li>писать  код;</li>"
+            "<li>ревьюить<br>тесты</li></ul><p>ДМС &amp; спорт</p>"
+        )
+
+        self.assertEqual(
+            html_to_text(html), "Задачи:\nписать код;\nревьюить\nтесты\nДМС & спорт"
+        )
+
+    def test_skips_scripts_and_empty_input(self):
+        html = "<style>p {}</style>Текст<script>x()</script>"
+
+        self.assertEqual(html_to_text(html), "Текст")
+        self.assertEqual(html_to_text(None), "")
+        self.assertEqual(html_to_text(""), "")
+
+
+def double(payload):
+    if payload < 0:
+        raise ValueError("отрицательное значение")
+    return {"value": payload * 2}
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.records = []
+
+    def add(self, record):
+        self.records.append(record)
+
+
+class IngestionPipelineTests(SimpleTestCase):
+    def source(self):
+        yield 1, 1, None
+        yield 2, None, RuntimeError("timeout")
+        yield 3, -3, None
+        for key in range(4, 120):
+            yield key, key, None
+
+    def test_parses_in_thread_and_collects_errors(self):
+        writer = RecordingWriter()
+
+        pipeline = IngestionPipeline(double, writer, parse_workers=0, queue_size=5)
+        pipeline.run(self.source())
+
+        self.assertEqual(len(writer.records), 117)
+        self.assertEqual(writer.records[0], {"value": 2})
+        self.assertEqual(
+            [(key, type(error)) for key, error in pipeline.errors],
+            [(2, RuntimeError), (3, ValueError)],
+        )
+
+    def test_parses_in_process_pool(self):
+        writer = RecordingWriter()
+
+        pipeline = IngestionPipeline(
+            double, writer, parse_workers=2, queue_size=10, chunk_size=7
+        )
+        pipeline.run(self.source())
+
+        self.assertEqual(
+            sorted(record["value"] for record in writer.records),
+            [2] + [key * 2 for key in range(4, 120)],
+        )
+        self.assertEqual(len(pipeline.errors), 2)
+
+    def test_source_failure_is_raised(self):
+        def broken():
+            yield 1, 1, None
+            raise ConnectionError("HH недоступен")
+
+        pipeline = IngestionPipeline(double, RecordingWriter(), parse_workers=0)
+        with self.assertRaises(ConnectionError):
+            pipeline.run(broken())
+
+
+class SalaryTests(SimpleTestCase):
+    def test_parses_telegram_and_stored_salary_strings(self):
+        cases = {
+            "Зарплата: от 150 000 до 200 000 руб. на руки": (150000, 200000, "RUB"),
+            "от 150000 до 250000 RUR": (150000, 250000, "RUB"),
+            "ЗП 120-180 тыс. ₽": (120000, 180000, "RUB"),
+            "до 300к": (None, 300000, "RUB"),
+            "$3000-4000": (3000, 4000, "USD"),
+            "По договоренности": (None, None, ""),
+            "200000, 10% бонус": (200000, None, "RUB"),
+            "от 100 000 до 150 000, 5/2": (100000, 150000, "RUB"),
+            "Зарплата 150000, звоните +7 999 123 45 67": (150000, None, "RUB"),
+            "$3,000-4,000": (3000, 4000, "USD"),
+            "от 1,5 тыс. руб.": (1500, None, "RUB"),
+            "ИНН 7707083893": (None, None, ""),
+            "от 150000руб": (150000, None, "RUB"),
+            "до 200000р.": (None, 200000, "RUB"),
+            "от 120 тысяч рублей": (120000, None, "RUB"),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                fields = parse_salary_text(text)
+                self.assertEqual(
+                    (
+                        fields["salary_from"],
+                        fields["salary_to"],
+                        fields["salary_currency"],
+                    ),
+                    expected,
+                )
+
+    def test_rub_monthly_is_net_midpoint_in_rubles(self):
+        def rub_monthly(*args, **kwargs):
+            return salary_fields(*args, **kwargs)["salary_rub_monthly"]
+
+        self.assertEqual(rub_monthly(100000, 200000, "RUR"), 150000)
+        self.assertEqual(rub_monthly(100000, None, "RUR", gross=True), 87000)
+        self.assertEqual(rub_monthly(1000, None, "usd"), 78500)
+        self.assertIsNone(rub_monthly(1000, None, "XYZ"))
+
+
+class BackfillSalaryCommandTests(TestCase):
+    def test_fills_structured_salary_in_batches(self):
+        for i, salary in enumerate(["от 150000 до 250000 RUR", "По договоренности", ""]):
+            Vacancy.objects.create(
+                title=f"Вакансия {i}",
+                url=f"https://example.com/{i}",
+                salary=salary,
+                published_at=datetime(2025, 6, 30, tzinfo=timezone.utc),
+            )
+
+        call_command("backfill_salary", batch_size=1, stdout=StringIO())
+
+        filled = Vacancy.objects.exclude(salary_rub_monthly=None)
+        self.assertEqual(
+            list(filled.values_list("salary_from", "salary_to", "salary_rub_monthly")),
+            [(150000, 250000, 200000)],
+        )
+
+
+def map_board_item(item):
+    if item["title"] is None:
+        raise ValueError("нет названия")
+    return {
+        "platform": "Board",
+        "platform_vacancy_id": f"Board{item['id']}",
+        "title": item["title"],
+        "url": f"https://board.example/{item['id']}",
+        "company": item["company"],
+        "published_at": item["published_at"],
+    }
+
+
+class BoardSource(VacancySource):
+    platform = "Board"
+    mapper = staticmethod(map_board_item)
+    query_concurrency = 2
+
+    def __init__(self, results):
+        self.results = results
+        self.searched = []
+
+    def search(self, params, since=None):
+        self.searched.append((params["q"], since))
+        result = self.results[params["q"]]
+        if isinstance(result, Exception):
+            raise result
+        return result, 1
+
+    def published_at(self, item):
+        return item["published_at"]
+
+    def fingerprint(self, item):
+        return fingerprint([item["title"], item["company"]])
+
+
+class IngestionEngineTests(TestCase):
+    def board_item(self, vacancy_id, title="Python-разработчик", hour=10):
+        return {
+            "id": vacancy_id,
+            "title": title,
+            "company": "Яндекс",
+            "published_at": datetime(2025, 6, 30, hour, tzinfo=timezone.utc),
+        }
+
+    def test_dedups_queries_skips_unchanged_and_holds_back_watermark(self):
+        python = [self.board_item("1"), self.board_item("2", hour=11)]
+        django = [self.board_item("2", hour=11), self.board_item("3", title=None)]
+        source = BoardSource({"python": python, "django": django, "go": OSError("503")})
+        engine = IngestionEngine(source, parse_workers=0)
+        queries = [{"q": "python"}, {"q": "django"}, {"q": "go"}]
+
+        first = engine.sync(queries)
+        second = engine.sync(queries)
+
+        self.assertEqual(first["saved_count"], 2)
+        self.assertEqual(first["pages_fetched"], 2)
+        self.assertEqual(
+            first["errors"], ["Запрос q=go: 503", "Вакансия 3: нет названия"]
+        )
+        self.assertEqual(first["inserted_count"], 2)
+        self.assertEqual(first["errors_by_class"], {"OSError": 1, "ValueError": 1})
+        self.assertEqual(second["saved_count"], 0)
+        self.assertEqual(second["skipped_count"], 2)
+        self.assertEqual(Vacancy.objects.filter(platform__name="Board").count(), 2)
+
+        watermarks = dict(
+            SyncWatermark.objects.filter(source="Board").values_list(
+                "query", "last_published_at"
+            )
+        )
+        self.assertEqual(
+            watermarks["q=python"], datetime(2025, 6, 30, 11, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            watermarks["q=django"], datetime(2025, 6, 30, 9, 55, tzinfo=timezone.utc)
+        )
+        self.assertIsNone(watermarks["q=go"])
+
+    def test_latency_percentiles(self):
+        stats = latency_percentiles([i / 1000 for i in range(1, 101)])
+
+        self.assertEqual(stats["http_requests"], 100)
+        self.assertEqual(stats["http_p50_ms"], 50.0)
+        self.assertEqual(stats["http_p99_ms"], 99.0)
+        self.assertIsNone(latency_percentiles([])["http_p95_ms"])
+
+
+DESCRIPTION = (
+    "Разрабатываем backend сервисов на Django и DRF, проектируем REST API для "
+    "мобильного клиента, оптимизируем запросы к PostgreSQL и покрываем код "
+    "тестами. Ждём опыт коммерческой разработки на Python от двух лет, знание "
+    "Django ORM, Celery и Docker. Предлагаем оформление по ТК РФ, ДМС и гибкое "
+    "начало рабочего дня."
+)
+
+
+class DuplicateDetectorTests(TestCase):
+    def vacancy(self, key, title, description, company="Яндекс"):
+        return Vacancy.objects.create(
+            title=title,
+            url=f"https://example.com/{key}",
+            company=Company.objects.get_or_create(name=company)[0],
+            description=description,
+            published_at=datetime(2025, 6, 30, tzinfo=timezone.utc),
+        )
+
+    def test_signature_similarity_tracks_jaccard(self):
+        left = shingles(DESCRIPTION)
+        right = shingles(DESCRIPTION.replace("двух", "трёх"))
+        jaccard = len(left & right) / len(left | right)
+
+        estimate = similarity(minhash(left), minhash(right))
+
+        self.assertAlmostEqual(estimate, jaccard, delta=0.15)
+
+    def test_links_cross_platform_copies_incrementally(self):
+        hh = self.vacancy("hh", "Python-разработчик (Django)", DESCRIPTION)
+        telegram = self.vacancy(
+            "tg", "Python-разработчик Django", DESCRIPTION + " Пишите в личку."
+        )
+        other = self.vacancy(
+            "other",
+            "Frontend-разработчик",
+            "Вёрстка на React и TypeScript, работа с дизайнерами в Figma.",
+            company="Ozon",
+        )
+
+        first = DuplicateDetector().run()
+        superjob = self.vacancy("sj", "Python-разработчик (Django)", DESCRIPTION)
+        second = DuplicateDetector().run()
+
+        self.assertEqual((first.processed, first.linked), (3, 1))
+        self.assertEqual((second.processed, second.linked), (1, 1))
+        cluster = hh.signature.cluster
+        self.assertIsNotNone(cluster)
+        self.assertEqual(
+            set(cluster.signatures.values_list("vacancy_id", flat=True)),
+            {hh.id, telegram.id, superjob.id},
+        )
+        other.refresh_from_db()
+        self.assertIsNone(other.signature.cluster)
+
+
+class RawArchiveTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.archive = RawArchive(tmp.name)
+
+    def append(self, key, title, day):
+        fetched_at = datetime(2025, 7, day, 12, tzinfo=timezone.utc)
+        self.archive.append(
+            "Board", key, {"id": key, "title": title}, f"fp-{title}", fetched_at
+        )
+
+    def test_latest_returns_last_version_of_each_key(self):
+        self.append("1", "Python", 1)
+        self.append("2", "Go", 1)
+        self.append("1", "Senior Python", 2)
+
+        latest = {r["key"]: r for r in self.archive.latest("Board")}
+
+        self.assertEqual(latest["1"]["payload"]["title"], "Senior Python")
+        self.assertEqual(latest["1"]["fingerprint"], "fp-Senior Python")
+        self.assertEqual(latest["2"]["payload"]["title"], "Go")
+        self.assertEqual(len(list(self.archive.iter_records("Board"))), 3)
+
+    def test_filters_partitions_by_day(self):
+        self.append("1", "Python", 1)
+        self.append("2", "Go", 2)
+
+        records = self.archive.iter_records("Board", since=date(2025, 7, 2))
+
+        self.assertEqual([r["key"] for r in records], ["2"])
+        self.assertEqual(list(self.archive.latest("Other")), [])
+
+
+class ReparseCommandTests(TestCase):
+    def test_restores_vacancies_from_archive(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        now = datetime(2025, 7, 1, tzinfo=timezone.utc)
+        adapter = ReplayAdapter(ReplayCorpus.load(count=20, now=now))
+
+        with (
+            override_settings(
+                INGESTION_ARCHIVE_ENABLED=True,
+                INGESTION_ARCHIVE_DIR=tmp.name,
+                SUPERJOB_RATE_LIMIT=1000,
+            ),
+            transport_override(adapter),
+            patch("django.utils.timezone.now", return_value=now),
+        ):
+            sync_superjob()
+            Vacancy.objects.update(title="", salary_from=None)
+            adapter.requests = 0
+            stdout = StringIO()
+            call_command("reparse", "--source", "superjob", stdout=stdout)
+
+        self.assertIn("переразобрано 20 вакансий, ошибок: 0", stdout.getvalue())
+        self.assertIn("Дубликаты: обработано 20 вакансий", stdout.getvalue())
+        self.assertEqual(adapter.requests, 0)
+        self.assertFalse(Vacancy.objects.filter(title="").exists())
+        self.assertTrue(Vacancy.objects.filter(salary_from__isnull=False).exists())
@@ -0,0 +1,65 @@
+import re
+from html.parser import HTMLParser
+
+# теги, после которых в тексте начинается новая строка
+BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "br",
+        "li",
+        "ul",
+        "ol",
+        "tr",
+        "table",
+        "blockquote",
+        "pre",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+    }
+)
+SKIP_TAGS = frozenset({"script", "style"})
+SPACES = re.compile(r"[^\S\n]+")
+
+
+class _TextExtractor(HTMLParser):
+    """Минимальный обработчик html.parser: собирает текстовые узлы и ставит
+    перевод строки на границах блоков, не строя дерево документа."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip = max(self.skip - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """Текст описания вакансии без разметки: абзацы и пункты списков
+    остаются на отдельных строках, пробелы внутри строки схлопываются."""
+    if not html:
+        return ""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    text = "".join(extractor.parts)
+    lines = (SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
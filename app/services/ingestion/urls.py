@@ -0,0 +1,8 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("runs/", views.run_list, name="ingestion_run_list"),
+    path("runs/<int:pk>/", views.run_detail, name="ingestion_run_detail"),
+]
@@ -0,0 +1,18 @@
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+
+from .models import IngestionRun
+
+RUN_LIST_LIMIT = 50
+
+
+def run_list(request):
+    runs = IngestionRun.objects.all()
+    if source := request.GET.get("source"):
+        runs = runs.filter(source=source)
+    return JsonResponse({"runs": [run.as_dict() for run in runs[:RUN_LIST_LIMIT]]})
+
+
+def run_detail(request, pk):
+    run = get_object_or_404(IngestionRun, pk=pk)
+    return JsonResponse(run.as_dict())
@@ -0,0 +1,60 @@
+import logging
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+# окна короче этого не делятся: больше max_depth вакансий за 10 минут —
+# редкость, и результаты такого окна просто обрезаются
+MIN_WINDOW = timedelta(minutes=10)
+
+
+class WindowCrawler:
+    """Обход поиска площадки, которая отдаёт не больше `max_depth`
+    результатов на один запрос.
+
+    Если запрос в окне публикации [date_from, date_to] находит больше
+    `max_depth` вакансий, окно делится пополам, пока каждое окно не станет
+    обходимым. Подкласс знает только API площадки: параметры окна, число
+    найденного на первой странице, загрузку страницы и обход остальных
+    страниц окна.
+    """
+
+    # название площадки для логов
+    name = None
+    max_depth = None
+
+    def __init__(self):
+        self.pages_fetched = 0
+        self.truncated_windows = 0
+
+    def window_params(self, params, date_from, date_to):
+        raise NotImplementedError
+
+    def fetch_page(self, params, page):
+        raise NotImplementedError
+
+    def total(self, first_page):
+        raise NotImplementedError
+
+    def iter_window(self, window_params, first_page):
+        """Результаты окна, начиная с уже загруженной первой страницы."""
+        raise NotImplementedError
+
+    def iter_windows(self, params, date_from, date_to):
+        window_params = self.window_params(params, date_from, date_to)
+        first_page = self.fetch_page(window_params, 0)
+        total = self.total(first_page)
+
+        if total > self.max_depth:
+            if date_to - date_from > MIN_WINDOW:
+                middle = date_from + (date_to - date_from) / 2
+                yield from self.iter_windows(params, date_from, middle)
+                yield from self.iter_windows(params, middle, date_to)
+                return
+            self.truncated_windows += 1
+            logger.warning(
+                f"{self.name}: окно {date_from}–{date_to} содержит {total} "
+                f"вакансий, будут получены только первые {self.max_depth}"
+            )
+
+        yield from self.iter_window(window_params, first_page)
@@ -0,0 +1,139 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from ..hh.hh_parser.fulltext import update_search_vector
+from ..hh.hh_parser.models import Vacancy
+from .models import VacancySignature
+from .resolver import DIMENSIONS, get_resolvers
+
+logger = logging.getLogger(__name__)
+
+UNIQUE_FIELDS = ["platform_vacancy_id"]
+UPDATE_FIELDS = [
+    field.name
+    for field in Vacancy._meta.concrete_fields
+    if not field.primary_key
+    and field.name not in UNIQUE_FIELDS + ["created_at", "search_vector"]
+]
+
+
+class VacancyBatchWriter:
+    """Накапливает вакансии и сохраняет их пачками через bulk upsert.
+
+    Вакансии передаются словарями полей Vacancy, где platform, company и
+    city указаны именами: они разрешаются в id один раз на пачку через
+    NameResolver. Повтор одного и того же platform_vacancy_id внутри
+    пачки схлопывается, побеждает последний.
+    Если пачка не записалась целиком, она повторяется построчно, чтобы
+    ошибка одной строки не теряла остальные.
+
+    Перед записью пачки читаются отпечатки её вакансий, которые уже есть в
+    базе: так upsert разделяется на `inserted` и `updated`, а у вакансий,
+    чей отпечаток изменился (или не известен), удаляется MinHash-сигнатура,
+    чтобы DuplicateDetector сравнил их заново. `write_seconds` —
+    суммарное время flush, включая разрешение имён.
+    """
+
+    def __init__(self, chunk_size=None, resolvers=None):
+        self.chunk_size = chunk_size or settings.INGESTION_WRITE_CHUNK_SIZE
+        self.resolvers = resolvers or get_resolvers()
+        self.pending = {}
+        self.written = 0
+        self.inserted = 0
+        self.updated = 0
+        self.write_seconds = 0.0
+        self.errors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, fields):
+        self.pending[fields["platform_vacancy_id"]] = fields
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return 0
+        started = time.perf_counter()
+        try:
+            return self._flush()
+        finally:
+            self.write_seconds += time.perf_counter() - started
+
+    def _flush(self):
+        records = self._resolve(list(self.pending.values()))
+        self.pending = {}
+
+        try:
+            written = self._upsert(records)
+        except DatabaseError as e:
+            logger.warning(f"Пакет из {len(records)} вакансий не записан: {e}")
+            written = 0
+            for record in records:
+                try:
+                    written += self._upsert([record])
+                except DatabaseError as row_error:
+                    self.errors.append((record["platform_vacancy_id"], row_error))
+
+        self.written += written
+        return written
+
+    def _resolve(self, records):
+        ids = {
+            field: self.resolvers[field].resolve_many(
+                record.get(field) for record in records
+            )
+            for field in DIMENSIONS
+        }
+        resolved = []
+        for record in records:
+            record = dict(record)
+            for field in DIMENSIONS:
+                record[f"{field}_id"] = ids[field].get(record.pop(field, None))
+            resolved.append(record)
+        return resolved
+
+    def _upsert(self, records):
+        keys = [record["platform_vacancy_id"] for record in records]
+        with transaction.atomic():
+            existing = dict(
+                Vacancy.objects.filter(platform_vacancy_id__in=keys).values_list(
+                    "platform_vacancy_id", "fingerprint"
+                )
+            )
+            self._reset_signatures(records, existing)
+            Vacancy.objects.bulk_create(
+                [Vacancy(**record) for record in records],
+                batch_size=self.chunk_size,
+                update_conflicts=True,
+                unique_fields=UNIQUE_FIELDS,
+                update_fields=UPDATE_FIELDS,
+            )
+            update_search_vector(Vacancy.objects.filter(platform_vacancy_id__in=keys))
+        self.inserted += len(records) - len(existing)
+        self.updated += len(existing)
+        return len(records)
+
+    def _reset_signatures(self, records, existing):
+        """Удаляет сигнатуры вакансий, содержимое которых могло измениться."""
+        changed = [
+            record["platform_vacancy_id"]
+            for record in records
+            if record["platform_vacancy_id"] in existing
+            and (
+                not record.get("fingerprint")
+                or record["fingerprint"] != existing[record["platform_vacancy_id"]]
+            )
+        ]
+        if changed:
+            VacancySignature.objects.filter(
+                vacancy__platform_vacancy_id__in=changed
+            ).delete()
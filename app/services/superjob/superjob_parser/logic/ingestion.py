@@ -0,0 +1,170 @@
+import os
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from dotenv import load_dotenv
+
+from ....hh.hh_parser.models import Platform
+from ....ingestion.engine import IngestionEngine
+from ....ingestion.http import ApiClient, TokenBucket
+from ....ingestion.salary import salary_fields
+from ....ingestion.sources import VacancySource, fingerprint
+from ....ingestion.text import html_to_text
+from ....ingestion.windows import WindowCrawler
+
+load_dotenv()
+
+SUPERJOB_VACANCIES_URL = "https://api.superjob.ru/2.0/vacancies"
+# SuperJob отдаёт не больше 500 результатов на один поисковый запрос
+SUPERJOB_MAX_DEPTH = 500
+SUPERJOB_MAX_PER_PAGE = 100
+DEFAULT_QUERY = {"keyword": "Python", "town": "Moscow"}
+
+
+def build_superjob_client(rate=None):
+    headers = {"X-Api-App-Id": os.getenv("SJ_KEY")}
+    bucket = TokenBucket(rate or settings.SUPERJOB_RATE_LIMIT)
+    return ApiClient(headers=headers, bucket=bucket)
+
+
+class SuperJobCrawler(WindowCrawler):
+    """Обходит страницы поиска SuperJob, пока API отвечает `more`.
+
+    Если запрос находит больше SUPERJOB_MAX_DEPTH вакансий, окно
+    публикации делится пополам, как в SearchCrawler для HH.
+    """
+
+    name = "SuperJob"
+    max_depth = SUPERJOB_MAX_DEPTH
+
+    def __init__(self, client=None, count=SUPERJOB_MAX_PER_PAGE):
+        super().__init__()
+        self.client = client or build_superjob_client()
+        self.count = min(count, SUPERJOB_MAX_PER_PAGE)
+
+    def fetch_page(self, params, page):
+        data = self.client.get_json(
+            SUPERJOB_VACANCIES_URL,
+            params={**params, "count": self.count, "page": page},
+        )
+        self.pages_fetched += 1
+        return data
+
+    def iter_objects(self, params, date_from=None, date_to=None):
+        date_to = date_to or timezone.now()
+        date_from = date_from or date_to - timedelta(
+            days=settings.SUPERJOB_SEARCH_PERIOD_DAYS
+        )
+        yield from self.iter_windows(params, date_from, date_to)
+
+    def window_params(self, params, date_from, date_to):
+        return {
+            **params,
+            "date_published_from": int(date_from.timestamp()),
+            "date_published_to": int(date_to.timestamp()),
+        }
+
+    def total(self, first_page):
+        return first_page.get("total", 0)
+
+    def iter_window(self, window_params, first_page):
+        max_pages = SUPERJOB_MAX_DEPTH // self.count
+        page = first_page
+        number = 0
+        while True:
+            yield from page.get("objects", [])
+            number += 1
+            if not page.get("more") or number >= max_pages:
+                return
+            page = self.fetch_page(window_params, number)
+
+
+def map_vacancy(item):
+    company = item.get("client", {}).get("title", "")
+    city = item.get("town", {}).get("title")
+
+    salary_from = int(item.get("payment_from", 0))
+    salary_to = int(item.get("payment_to", 0))
+    salary_currency = item.get("currency")
+    salary = "По договоренности"
+    if salary_from or salary_to:
+        salary_parts = []
+        if salary_from:
+            salary_parts.append(f"от {salary_from}")
+        if salary_to:
+            salary_parts.append(f"до {salary_to}")
+        if salary_currency:
+            salary_parts.append(salary_currency)
+        salary = " ".join(salary_parts)
+
+    description = html_to_text(item.get("vacancyRichText", ""))
+
+    title = item.get("profession")
+    experience = item.get("experience", {}).get("title")
+    education = item.get("education", {}).get("title")
+    type_of_work = item.get("type_of_work", {}).get("title")
+    place_of_work = item.get("place_of_work", {}).get("title")
+    skills = item.get("candidat")
+    address = item.get("address")
+    link = item.get("link")
+    published_at = datetime.fromtimestamp(
+        item.get("date_published"), tz=timezone.get_current_timezone()
+    )
+    platform_vacancy_id = f"{Platform.SUPER_JOB}{item.get('id')}"
+    contacts = item.get("phone")
+
+    return {
+        "platform": Platform.SUPER_JOB,
+        "city": city,
+        "company": company,
+        "platform_vacancy_id": platform_vacancy_id,
+        "title": title,
+        "url": link,
+        "salary": salary,
+        "experience": experience,
+        "schedule": type_of_work,
+        "employment": type_of_work,
+        "work_format": place_of_work,
+        "education": education,
+        "description": description,
+        "skills": skills,
+        "address": address,
+        "contacts": contacts,
+        "published_at": published_at,
+        **salary_fields(salary_from, salary_to, salary_currency),
+    }
+
+
+class SuperJobSource(VacancySource):
+    """Выдача SuperJob уже содержит все поля вакансии, поэтому догрузки нет,
+    а отпечаток считается по объекту целиком."""
+
+    platform = Platform.SUPER_JOB
+    mapper = staticmethod(map_vacancy)
+
+    def __init__(self, client=None):
+        self.client = client or build_superjob_client()
+
+    def default_queries(self):
+        return [DEFAULT_QUERY]
+
+    def search(self, params, since=None):
+        crawler = SuperJobCrawler(self.client)
+        objects = list(crawler.iter_objects(params, date_from=since))
+        return objects, crawler.pages_fetched
+
+    def published_at(self, item):
+        return datetime.fromtimestamp(
+            item.get("date_published"), tz=timezone.get_current_timezone()
+        )
+
+    def fingerprint(self, item):
+        return fingerprint(item)
+
+
+def sync_superjob(params=None, full=False, parse_workers=None):
+    queries = [params] if params else None
+    return IngestionEngine(SuperJobSource(), parse_workers=parse_workers).sync(
+        queries, full
+    )
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.services.hh.hh_parser.models import Platform
+from app.services.ingestion.dedup import DuplicateDetector
+from app.services.ingestion.models import IngestionRun
+from app.services.ingestion.runs import claim_run, execute_run
+from app.services.superjob.superjob_parser.logic.ingestion import (
+    DEFAULT_QUERY,
+    sync_superjob,
+)
+
+
+class Command(BaseCommand):
+    help = "Загружает вакансии SuperJob вне HTTP-запроса"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keyword", default=DEFAULT_QUERY["keyword"])
+        parser.add_argument(
+            "--town",
+            default=DEFAULT_QUERY["town"],
+            help="Город; пустая строка — поиск по всем городам",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Игнорировать watermark и загрузить всё окно поиска",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            help="Процессов для разбора ответов API, 0 — разбор в потоке",
+        )
+        parser.add_argument(
+            "--skip-dedup",
+            action="store_true",
+            help="Не искать дубликаты среди новых и изменившихся вакансий",
+        )
+
+    def handle(self, *args, **options):
+        params = {"keyword": options["keyword"]}
+        if options["town"]:
+            params["town"] = options["town"]
+
+        run = claim_run(Platform.SUPER_JOB)
+        if run is None:
+            self.stdout.write(
+                self.style.WARNING("SuperJob: предыдущий запуск ещё выполняется")
+            )
+            return
+        self.stdout.write(f"Запуск SuperJob #{run.id}")
+        run = execute_run(
+            run,
+            sync_superjob,
+            params=params,
+            full=options["full"],
+            parse_workers=options["parse_workers"],
+        )
+
+        for error in run.errors:
+            self.stderr.write(error)
+        if run.status == IngestionRun.FAILED:
+            raise CommandError(run.message)
+        self.stdout.write(self.style.SUCCESS(run.message))
+        if not options["skip_dedup"]:
+            detector = DuplicateDetector().run()
+            self.stdout.write(
+                f"Дубликаты: обработано {detector.processed} вакансий, "
+                f"найдено {detector.linked}"
+            )
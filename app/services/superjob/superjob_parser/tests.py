@@ -1,3 +1,108 @@
-# from django.test import TestCase
+from datetime import datetime, timezone
+from unittest.mock import patch
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from app.services.hh.hh_parser.models import Vacancy
+from app.services.ingestion.http import transport_override
+from app.services.ingestion.models import IngestionRun, SyncWatermark
+from app.services.ingestion.replay import ReplayAdapter, ReplayCorpus
+from app.services.superjob.superjob_parser.logic.ingestion import (
+    SuperJobCrawler,
+    build_superjob_client,
+    sync_superjob,
+)
+
+NOW = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+@override_settings(SUPERJOB_RATE_LIMIT=1000)
+class SuperJobCrawlerTests(SimpleTestCase):
+    def crawl(self, count):
+        adapter = ReplayAdapter(ReplayCorpus.load(count=count, now=NOW))
+        with transport_override(adapter):
+            crawler = SuperJobCrawler(build_superjob_client())
+            objects = list(crawler.iter_objects({"keyword": "Python"}, date_to=NOW))
+        return crawler, objects
+
+    def test_pages_until_more_is_false(self):
+        crawler, objects = self.crawl(250)
+
+        self.assertEqual(crawler.pages_fetched, 3)
+        self.assertEqual(len({item["id"] for item in objects}), 250)
+
+    def test_splits_window_above_depth_limit(self):
+        crawler, objects = self.crawl(1200)
+
+        self.assertEqual(len({item["id"] for item in objects}), 1200)
+        self.assertEqual(crawler.truncated_windows, 0)
+
+
+@override_settings(SUPERJOB_RATE_LIMIT=1000)
+class SyncSuperJobTests(TestCase):
+    def setUp(self):
+        self.adapter = ReplayAdapter(ReplayCorpus.load(count=30, now=NOW))
+        self.search_params = []
+        send = self.adapter.send
+
+        def recording_send(request, **kwargs):
+            self.search_params.append(request.url)
+            return send(request, **kwargs)
+
+        self.adapter.send = recording_send
+
+    def sync(self, **kwargs):
+        with (
+            transport_override(self.adapter),
+            patch("django.utils.timezone.now", return_value=NOW),
+        ):
+            return sync_superjob(**kwargs)
+
+    def test_saves_vacancies_and_advances_watermark(self):
+        result = self.sync()
+
+        self.assertEqual(result["saved_count"], 30)
+        self.assertEqual(result["inserted_count"], 30)
+        self.assertEqual(result["http_requests"], 1)
+        self.assertEqual(Vacancy.objects.count(), 30)
+        vacancy = Vacancy.objects.get(platform_vacancy_id="SuperJob60000000")
+        self.assertEqual(vacancy.salary_currency, "RUB")
+        self.assertIn(
+            vacancy.education, {"Высшее", "Не имеет значения", "Неполное высшее"}
+        )
+        self.assertIn("Обязанности:\n", vacancy.description)
+        watermark = SyncWatermark.objects.get(source="SuperJob")
+        self.assertEqual(watermark.last_published_at, NOW)
+
+    def test_second_run_starts_from_watermark(self):
+        self.sync()
+        self.search_params.clear()
+        self.sync()
+
+        self.assertIn(
+            f"date_published_from={int(NOW.timestamp()) - 300}", self.search_params[0]
+        )
+
+    def test_full_run_ignores_watermark(self):
+        self.sync()
+        self.search_params.clear()
+        self.sync(full=True)
+
+        self.assertNotIn(
+            f"date_published_from={int(NOW.timestamp()) - 300}", self.search_params[0]
+        )
+
+
+class SuperJobListViewTests(TestCase):
+    def test_enqueues_run_once(self):
+        resp = self.client.get(reverse("superjob_list"))
+
+        self.assertEqual(resp.status_code, 202)
+        run = IngestionRun.objects.get(id=resp.json()["run_id"])
+        self.assertEqual(run.source, "SuperJob")
+        self.assertEqual(run.status, IngestionRun.PENDING)
+
+        resp = self.client.get(reverse("superjob_list"))
+        self.assertEqual(resp.status_code, 409)
+        self.assertEqual(resp.json()["run_id"], run.id)
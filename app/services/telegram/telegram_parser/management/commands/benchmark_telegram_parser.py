@@ -0,0 +1,178 @@
+import re
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from app.services.hh.hh_parser.models import Vacancy
+from app.services.ingestion.salary import parse_salary_text
+from app.services.telegram.telegram_parser.parser.corpus import (
+    load_corpus,
+    offline_parser,
+)
+from app.services.telegram.telegram_parser.parser.line_parser import (
+    LineParser,
+    keyword_stripper,
+)
+from app.services.telegram.telegram_parser.parser.vacancy_parser import (
+    VALUE_FIELDS,
+    VacancyParser,
+)
+
+
+class LegacyLineParser:
+    """Прежний LineParser: шаблоны берутся из кэша re при каждом вызове,
+    ключевые слова зарплаты вырезаются по одному как регулярные выражения."""
+
+    @staticmethod
+    def extract_value(line):
+        parts = re.split(r"[:\-\u2014]", line, maxsplit=1)
+        return parts[1].strip() if len(parts) > 1 else line.strip()
+
+    @staticmethod
+    def extract_salary(line, keywords):
+        cleaned_line = line
+        for kw in keywords:
+            cleaned_line = re.sub(kw, "", cleaned_line, flags=re.IGNORECASE)
+        match = re.search(r"(от\s*)?\d[\d\s.,]{3,}", cleaned_line.lower())
+        return match.group().strip() if match else None
+
+    @staticmethod
+    def extract_phone(line):
+        match_username = re.search(r"@\w+", line)
+        if match_username:
+            return match_username.group()
+        match_phone = re.search(
+            r"""(\+7|8)?[\s\-]?\(?\d{3}\)?[\s\-]
+?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}""",
+            line,
+        )
+        return match_phone.group() if match_phone else None
+
+    @staticmethod
+    def extract_link(line):
+        match = re.search(r"https?://[^\s]+|t\.me/[^\s]+", line)
+        return match.group() if match else None
+
+
+class LegacyParser(VacancyParser):
+    """Прежний разбор: подстрочный поиск каждого ключевого слова каждого
+    поля, список замыканий, который проверяется для каждой строки, и
+    LegacyLineParser."""
+
+    def matches(self, line, field):
+        return any(kw in line.lower() for kw in self.keywords[field])
+
+    def parse_text(self, text):
+        lines = text.strip().splitlines()
+        parser = LegacyLineParser()
+
+        field_names = [field.name for field in Vacancy._meta.get_fields()]
+        data = dict.fromkeys(field_names)
+        data["title"] = next((line.strip() for line in lines if line.strip()), None)
+
+        actions = [
+            (
+                "salary",
+                lambda line: (
+                    parser.extract_salary(line, self.keywords["salary"])
+                    if self.matches(line, "salary")
+                    else None
+                ),
+            )
+        ]
+        for field in VALUE_FIELDS:
+            actions.append(
+                (
+                    field,
+                    lambda line, field=field: (
+                        parser.extract_value(line) if self.matches(line, field) else None
+                    ),
+                )
+            )
+        actions += [("contacts", parser.extract_phone), ("url", parser.extract_link)]
+
+        for line in lines:
+            line = line.strip()
+            for key, func in actions:
+                if not data[key]:
+                    value = func(line)
+                    if value:
+                        data[key] = value
+
+        salary_line = next(
+            (line for line in lines if self.matches(line, "salary")), None
+        )
+        data.update(parse_salary_text(salary_line))
+        return data
+
+
+PARSERS = {"legacy": LegacyParser, "current": VacancyParser}
+
+
+def legacy_line_extractors(keywords):
+    return [
+        LegacyLineParser.extract_value,
+        lambda line: LegacyLineParser.extract_salary(line, keywords["salary"]),
+        LegacyLineParser.extract_phone,
+        LegacyLineParser.extract_link,
+    ]
+
+
+def current_line_extractors(keywords):
+    stripper = keyword_stripper(keywords["salary"])
+    return [
+        LineParser.extract_value,
+        lambda line: LineParser.extract_salary(line, stripper),
+        LineParser.extract_phone,
+        LineParser.extract_link,
+    ]
+
+
+LINE_PARSERS = {"legacy": legacy_line_extractors, "current": current_line_extractors}
+
+
+class Command(BaseCommand):
+    help = "Сравнивает скорость разбора постов Telegram-каналов"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--copies", type=int, default=100, help="Сколько раз повторить корпус"
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Число прогонов")
+
+    def handle(self, *args, **options):
+        corpus = load_corpus()
+        posts = corpus["posts"] * options["copies"]
+        lines = [line.strip() for post in posts for line in post.splitlines()]
+
+        self.stdout.write("VacancyParser.parse_text")
+        timings = {}
+        for name, parser_class in PARSERS.items():
+            parser = offline_parser(parser_class, corpus["keywords"])
+            timings[name] = self.measure(
+                lambda parser=parser: [parser.parse_text(post) for post in posts],
+                options["repeat"],
+            )
+            self.report(name, len(posts), "постов", "пост/с", timings[name])
+        self.stdout.write(f"Ускорение: x{timings['legacy'] / timings['current']:.1f}")
+
+        self.stdout.write("LineParser, все извлекатели на каждой строке")
+        timings = {}
+        for name, build in LINE_PARSERS.items():
+            extractors = build(corpus["keywords"])
+            timings[name] = self.measure(
+                lambda extractors=extractors: [
+                    extract(line) for line in lines for extract in extractors
+                ],
+                options["repeat"],
+            )
+            self.report(name, len(lines), "строк", "стр/с", timings[name])
+        self.stdout.write(f"Ускорение: x{timings['legacy'] / timings['current']:.1f}")
+
+    def measure(self, run, repeat):
+        return min(timeit.repeat(run, number=1, repeat=repeat))
+
+    def report(self, name, count, items, unit, seconds):
+        self.stdout.write(
+            f"{name}: {count} {items} за {seconds:.3f} с, {count / seconds:.0f} {unit}"
+        )
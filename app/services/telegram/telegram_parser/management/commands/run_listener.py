@@ -9,6 +9,9 @@ from app.services.telegram.telegram_parser.views import TelegramParserView
 
 logger = logging.getLogger(__name__)
 
+# как часто сверять набор каналов с активными каналами в БД, секунды
+CHANNELS_REFRESH_INTERVAL = 300
+
 
 class Command(BaseCommand):
     help = "Запускает Telegram слушатель"
@@ -19,11 +22,10 @@ class Command(BaseCommand):
     async def start_listener(self):
         parser = TelegramParserView()
         await parser.initialize()  # Инициализация клиента
+        listener = asyncio.create_task(parser.run())
         logger.info("Слушатель телеграм работает!")
 
-        listened_channels = set()
-
-        while True:
+        while not listener.done():
             channels = await sync_to_async(
                 lambda: list(
                     Channel.objects.filter(status="active").values_list(
@@ -31,12 +33,7 @@ class Command(BaseCommand):
                     )
                 )
             )()
+            await parser.update_channels(channels)
+            await asyncio.wait({listener}, timeout=CHANNELS_REFRESH_INTERVAL)
 
-            new_channels = [c for c in channels if c not in listened_channels]
-
-            for channel in new_channels:
-                logger.info(f"▶️ Подключение к новому каналу: {channel}")
-                asyncio.create_task(parser.channel_listener(channel))
-                listened_channels.add(channel)
-
-            await asyncio.sleep(300)
+        await listener
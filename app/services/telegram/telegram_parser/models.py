@@ -12,6 +12,7 @@ class KeyWord(models.Model):
     work_format = models.JSONField(verbose_name="work_format", default=list, blank=True)
     address = models.JSONField(verbose_name="address", default=list, blank=True)
     description = models.JSONField(verbose_name="description", default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Telegram keywords - {self.id}"
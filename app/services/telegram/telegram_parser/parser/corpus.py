@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+
+from .keyword_matcher import KeywordMatcher
+from .line_parser import keyword_stripper
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+CORPUS_FILE = FIXTURES_DIR / "channel_posts.json"
+# результат разбора корпуса прежней реализацией VacancyParser (без None),
+# с которым сверяется текущая
+GOLDEN_FILE = FIXTURES_DIR / "channel_posts_parsed.json"
+
+
+def load_corpus():
+    """Посты в формате IT-каналов с вакансиями и ключевые слова к ним."""
+    with open(CORPUS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_golden():
+    with open(GOLDEN_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def offline_parser(parser_class, keywords):
+    """Парсер с ключевыми словами из корпуса, без обращения к KeyWord."""
+    parser = parser_class()
+    parser.keywords = keywords
+    parser.matcher = KeywordMatcher(keywords)
+    parser.salary_stripper = keyword_stripper(keywords["salary"])
+    return parser
@@ -1,18 +1,89 @@
+import threading
+import time
+
 from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import models
+from django.db.models import Count, Max
 
 from ..models import KeyWord
+from .keyword_matcher import KeywordMatcher
+from .line_parser import keyword_stripper
+
+KEYWORD_FIELDS = [
+    field.name for field in KeyWord._meta.fields if isinstance(field, models.JSONField)
+]
+
+
+class KeywordCache:
+    """Ключевые слова KeyWord, общие для всего процесса.
+
+    Версия набора — пара (последний updated_at, число строк), чтобы
+    заметить и изменение, и удаление. Изменения в этом процессе сбрасывают
+    кэш через сигналы KeyWord; изменения из других процессов (например,
+    из админки) замечаются проверкой версии не чаще раза в
+    TELEGRAM_KEYWORDS_CHECK_INTERVAL секунд. Между проверками ключевые
+    слова отдаются без обращения к БД. KeywordMatcher и регулярное
+    выражение для ключевых слов зарплаты перестраиваются только вместе
+    с ключевыми словами.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.keywords = None
+        self.matcher = None
+        self.salary_stripper = None
+        self.version = None
+        self._clock = clock
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        self._checked_at = None
+
+    def needs_check(self):
+        if self.keywords is None or self._checked_at is None:
+            return True
+        interval = settings.TELEGRAM_KEYWORDS_CHECK_INTERVAL
+        return self._clock() - self._checked_at >= interval
+
+    def refresh(self):
+        """Сверяет версию с БД и перечитывает ключевые слова, если она
+        изменилась. Возвращает текущий набор."""
+        with self._lock:
+            stamp = KeyWord.objects.aggregate(
+                updated_at=Max("updated_at"), rows=Count("id")
+            )
+            version = (stamp["updated_at"], stamp["rows"])
+            if self.keywords is None or version != self.version:
+                keywords = KeyWord.objects.order_by("id").values().first()
+                if not keywords:
+                    raise ValueError("KeyWords data not found")
+                self.matcher = KeywordMatcher(
+                    {field: keywords[field] for field in KEYWORD_FIELDS}
+                )
+                self.salary_stripper = keyword_stripper(keywords["salary"])
+                self.keywords, self.version = keywords, version
+            self._checked_at = self._clock()
+            return self.keywords
+
+
+keyword_cache = KeywordCache()
 
 
 class KeywordExtractor:
     def __init__(self):
         self.keywords = None
+        self.matcher = None
+        self.salary_stripper = None
 
-    @sync_to_async
-    def load_keywords(self):
-        kw = KeyWord.objects.all()
-        if not kw:
-            raise ValueError("KeyWords data not found")
-        self.keywords = list(kw.values())[0]
+    async def load_keywords(self):
+        # обращаемся к БД, только когда пора сверить версию
+        if keyword_cache.needs_check():
+            await sync_to_async(keyword_cache.refresh)()
+        self.keywords = keyword_cache.keywords
+        self.matcher = keyword_cache.matcher
+        self.salary_stripper = keyword_cache.salary_stripper
 
-    def matches(self, line, field):
-        return any(kw in line.lower() for kw in self.keywords[field])
+    def matched_fields(self, line):
+        """Поля, ключевые слова которых встречаются в строке."""
+        return self.matcher.fields(line.lower())
@@ -0,0 +1,61 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """Автомат Ахо — Корасик над ключевыми словами всех полей.
+
+    За один проход по строке возвращает множество полей, хотя бы одно
+    ключевое слово которых входит в строку подстрокой, — то же, что
+    `any(kw in line for kw in keywords[field])` для каждого поля, но без
+    повторного сканирования строки на каждое слово. Переходы с учётом
+    суффиксных ссылок раскрыты заранее, поэтому на символ приходится один
+    поиск в словаре.
+    """
+
+    def __init__(self, keywords):
+        goto = [{}]
+        outputs = [set()]
+        # пустое ключевое слово входит в любую строку
+        always = set()
+        for field, words in keywords.items():
+            for word in words:
+                if not word:
+                    always.add(field)
+                    continue
+                state = 0
+                for char in word:
+                    if char not in goto[state]:
+                        goto[state][char] = len(goto)
+                        goto.append({})
+                        outputs.append(set())
+                    state = goto[state][char]
+                outputs[state].add(field)
+
+        # обход в ширину: суффиксная ссылка узла всегда ведёт на меньшую
+        # глубину, поэтому к моменту её использования она уже достроена
+        fail = [0] * len(goto)
+        transitions = [goto[0]] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {**transitions[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0)
+                outputs[child] |= outputs[fail[child]]
+                queue.append(child)
+
+        self.always = frozenset(always)
+        self.transitions = transitions
+        self.outputs = [frozenset(fields) for fields in outputs]
+
+    def fields(self, text):
+        """Поля, ключевые слова которых встречаются в `text`."""
+        found = set(self.always)
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
@@ -1,33 +1,50 @@
 import re
 
+VALUE_SEPARATOR = re.compile(r"[:\-\u2014]")
+SALARY_AMOUNT = re.compile(r"(от\s*)?\d[\d\s.,]{3,}")
+USERNAME = re.compile(r"@\w+")
+# перевод строки внутри шаблона необязателен и оставлен как в исходном
+# варианте, где шаблон был записан в тройных кавычках с переносом
+PHONE = re.compile(
+    r"(\+7|8)?[\s\-]?\(?\d{3}\)?[\s\-]" "\n" r"?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}"
+)
+LINK = re.compile(r"https?://[^\s]+|t\.me/[^\s]+")
+# ничего не находит: для пустого списка ключевых слов
+NOTHING = re.compile(r"(?!)")
+
+
+def keyword_stripper(keywords):
+    """Одно регулярное выражение, которое находит любое из ключевых слов
+    без учёта регистра. Слова экранируются, более длинные идут первыми."""
+    words = sorted({kw for kw in keywords if kw}, key=len, reverse=True)
+    if not words:
+        return NOTHING
+    return re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+
 
 class LineParser:
     @staticmethod
     def extract_value(line):
-        parts = re.split(r"[:\-\u2014]", line, maxsplit=1)
+        parts = VALUE_SEPARATOR.split(line, maxsplit=1)
         return parts[1].strip() if len(parts) > 1 else line.strip()
 
     @staticmethod
-    def extract_salary(line, keywords):
-        cleaned_line = line
-        for kw in keywords:
-            cleaned_line = re.sub(kw, "", cleaned_line, flags=re.IGNORECASE)
-        match = re.search(r"(от\s*)?\d[\d\s.,]{3,}", cleaned_line.lower())
+    def extract_salary(line, stripper):
+        """Сумма из строки о зарплате. `stripper` — результат
+        keyword_stripper() для ключевых слов поля salary: они вырезаются,
+        чтобы цифры в них не принимались за сумму."""
+        match = SALARY_AMOUNT.search(stripper.sub("", line).lower())
         return match.group().strip() if match else None
 
     @staticmethod
     def extract_phone(line):
-        match_username = re.search(r"@\w+", line)
+        match_username = USERNAME.search(line)
         if match_username:
             return match_username.group()
-        match_phone = re.search(
-            r"""(\+7|8)?[\s\-]?\(?\d{3}\)?[\s\-]
-?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}""",
-            line,
-        )
+        match_phone = PHONE.search(line)
         return match_phone.group() if match_phone else None
 
     @staticmethod
     def extract_link(line):
-        match = re.search(r"https?://[^\s]+|t\.me/[^\s]+", line)
+        match = LINK.search(line)
         return match.group() if match else None
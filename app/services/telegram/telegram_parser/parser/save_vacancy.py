@@ -4,42 +4,51 @@ import uuid
 
 from asgiref.sync import sync_to_async
 
-from app.services.hh.hh_parser.models import City, Company, Platform, Vacancy
+from app.services.ingestion.archive import get_archive
+from app.services.ingestion.resolver import get_resolvers
+from app.services.ingestion.writer import VacancyBatchWriter
+
+from .source import TelegramSource, map_message, post_id
 
 logger = logging.getLogger(__name__)
 
 
 class SaveDataVacancy:
+    """Записывает посты по одному, по мере прихода. Конвейер
+    IngestionEngine с потоками и очередями рассчитан на пачки, поэтому
+    пост сразу проходит map_message и VacancyBatchWriter."""
+
+    def __init__(self):
+        self.resolvers = None
+        self.archive = get_archive()
+
     @sync_to_async
-    def save_vacancy(self, parsed, date):
-        city, company = None, None
-
-        platform, _ = Platform.objects.get_or_create(name=Platform.TELEGRAM)
-        if parsed["company"]:
-            company, _ = Company.objects.get_or_create(name=parsed["company"])
-        if parsed["city"]:
-            city, _ = City.objects.get_or_create(name=parsed["city"])
-
-        platform_vacancy_id = f"{Platform.TELEGRAM}{uuid.uuid4()}"
-
-        Vacancy.objects.update_or_create(
-            platform_vacancy_id=platform_vacancy_id,
-            defaults={
-                "platform": platform,
-                "city": city,
-                "company": company,
-                "platform_vacancy_id": platform_vacancy_id,
-                "title": parsed["title"],
-                "salary": parsed["salary"],
-                "url": parsed["url"],
-                "experience": parsed["experience"],
-                "schedule": parsed["schedule"],
-                "work_format": parsed["work_format"],
-                "skills": parsed["skills"],
-                "description": parsed["description"],
-                "address": parsed["address"],
-                "contacts": parsed["contacts"],
-                "published_at": datetime.datetime.now(),
-            },
-        )
+    def save_vacancy(self, parsed, date, text="", chat_id=None, message_id=None):
+        # слушатель живёт долго, поэтому справочники кэшируются между сообщениями
+        if self.resolvers is None:
+            self.resolvers = get_resolvers()
+
+        payload = {
+            "id": post_id(chat_id, message_id)
+            if message_id is not None
+            else str(uuid.uuid4()),
+            "text": text,
+            "parsed": parsed,
+            "date": date or datetime.datetime.now(datetime.timezone.utc),
+        }
+        self.archive_payload(payload)
+        with VacancyBatchWriter(chunk_size=1, resolvers=self.resolvers) as writer:
+            writer.add(map_message(payload))
+        if writer.errors:
+            _, error = writer.errors[0]
+            raise error
         logger.info("Данные в модель успешно записаны")
+
+    def archive_payload(self, payload):
+        if self.archive is None:
+            return
+        try:
+            self.archive.append(TelegramSource.platform, payload["id"], payload)
+        except OSError as e:
+            # архив вспомогательный, запись поста из-за него не прерываем
+            logger.warning(f"Архив: пост {payload['id']} не сохранён: {e}")
@@ -0,0 +1,61 @@
+from asgiref.sync import async_to_sync
+
+from app.services.hh.hh_parser.models import Platform
+from app.services.ingestion.salary import SALARY_FIELDS
+from app.services.ingestion.sources import VacancySource
+
+from .vacancy_parser import VacancyParser
+
+MESSAGE_FIELDS = (
+    "city",
+    "company",
+    "title",
+    "salary",
+    "url",
+    "experience",
+    "schedule",
+    "work_format",
+    "skills",
+    "description",
+    "address",
+    "contacts",
+    *SALARY_FIELDS,
+)
+
+
+def post_id(chat_id, message_id):
+    """Ключ поста: id сообщения уникален только внутри канала. Правка
+    поста даёт тот же ключ, и вакансия обновляется, а не дублируется."""
+    return f"{chat_id}:{message_id}"
+
+
+def map_message(payload):
+    """Поля вакансии из поста, уже разобранного VacancyParser."""
+    parsed = payload["parsed"]
+    return {
+        "platform": Platform.TELEGRAM,
+        "platform_vacancy_id": f"{Platform.TELEGRAM}{payload['id']}",
+        "published_at": payload["date"],
+        **{field: parsed[field] for field in MESSAGE_FIELDS},
+    }
+
+
+class TelegramSource(VacancySource):
+    """Посты приходят от слушателя каналов и пишутся SaveDataVacancy,
+    поэтому поиска у адаптера нет: движок с ним нужен только команде
+    reparse."""
+
+    platform = Platform.TELEGRAM
+    mapper = staticmethod(map_message)
+
+    def replay(self, payloads):
+        # в архиве лежит исходный текст поста, разбираем его заново текущим
+        # VacancyParser; ключевые слова загружаются один раз в этом потоке
+        parser = VacancyParser()
+        async_to_sync(parser.load_keywords)()
+        return (
+            (vacancy_id, {**payload, "parsed": parser.parse_text(payload["text"])}, None)
+            if not error and payload.get("text")
+            else (vacancy_id, payload, error)
+            for vacancy_id, payload, error in payloads
+        )
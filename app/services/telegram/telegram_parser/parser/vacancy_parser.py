@@ -1,8 +1,33 @@
+from functools import cache
+
 from app.services.hh.hh_parser.models import Vacancy
+from app.services.ingestion.salary import parse_salary_text
 
 from .keyword_extractor import KeywordExtractor
 from .line_parser import LineParser
 
+# поля, значение которых берётся из строки с ключевым словом этого поля
+VALUE_FIELDS = (
+    "company",
+    "city",
+    "schedule",
+    "work_format",
+    "skills",
+    "description",
+    "address",
+    "experience",
+)
+# поля, которые ищутся в каждой строке по шаблону, без ключевых слов
+PATTERN_FIELDS = {
+    "contacts": LineParser.extract_phone,
+    "url": LineParser.extract_link,
+}
+
+
+@cache
+def vacancy_field_names():
+    return tuple(field.name for field in Vacancy._meta.get_fields())
+
 
 class VacancyParser(KeywordExtractor):
     def __init__(self):
@@ -10,81 +35,63 @@ class VacancyParser(KeywordExtractor):
 
     async def parse_vacancy_from_text(self, text):
         await self.load_keywords()
+        return self.parse_text(text)
 
-        lines = text.strip().splitlines()
-        parser = LineParser()
+    def parse_text(self, text):
+        """Разбирает пост по уже загруженным ключевым словам.
 
-        all_fields = Vacancy._meta.get_fields()
-        field_names = [field.name for field in all_fields]
+        Каждая строка классифицируется один раз: KeywordMatcher отдаёт
+        поля, чьи ключевые слова в ней встречаются, и вызываются только их
+        извлекатели. Поле заполняется первым непустым значением; когда
+        заполнены все поля и найдена строка с зарплатой, остальные строки
+        не просматриваются.
+        """
+        lines = text.strip().splitlines()
 
-        data = dict.fromkeys(field_names)
+        data = dict.fromkeys(vacancy_field_names())
         data["title"] = next((line.strip() for line in lines if line.strip()), None)
 
-        actions = [
-            (
-                "company",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "company")
-                else None,
-            ),
-            (
-                "salary",
-                lambda line: parser.extract_salary(line, self.keywords["salary"])
-                if self.matches(line, "salary")
-                else None,
-            ),
-            (
-                "city",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "city")
-                else None,
-            ),
-            (
-                "schedule",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "schedule")
-                else None,
-            ),
-            (
-                "work_format",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "work_format")
-                else None,
-            ),
-            (
-                "skills",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "skills")
-                else None,
-            ),
-            (
-                "description",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "description")
-                else None,
-            ),
-            (
-                "address",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "address")
-                else None,
-            ),
-            (
-                "experience",
-                lambda line: parser.extract_value(line)
-                if self.matches(line, "experience")
-                else None,
-            ),
-            ("contacts", parser.extract_phone),
-            ("url", parser.extract_link),
-        ]
-
-        for line in lines:
-            line = line.strip()
-            for key, func in actions:
-                if not data[key]:
-                    value = func(line)
-                    if value:
-                        data[key] = value
+        pending = {"salary", *VALUE_FIELDS, *PATTERN_FIELDS}
+        salary_line = None
+        for raw_line in lines:
+            line = raw_line.strip()
+            fields = self.matched_fields(line)
+            if salary_line is None and self._is_salary_line(raw_line, line, fields):
+                salary_line = raw_line
+            if pending:
+                self._extract(line, fields, pending, data)
+            elif salary_line is not None:
+                break
+
+        # вилку и валюту разбираем по всей строке, а не по найденной сумме
+        data.update(parse_salary_text(salary_line))
 
         return data
+
+    def _is_salary_line(self, raw_line, line, fields):
+        if raw_line != line:
+            fields = self.matched_fields(raw_line)
+        return "salary" in fields
+
+    def _extract(self, line, fields, pending, data):
+        """Заполняет из строки ещё не найденные поля и убирает их из pending."""
+        value = None
+        for field in fields & pending:
+            if field == "salary":
+                salary = LineParser.extract_salary(line, self.salary_stripper)
+                if salary:
+                    data["salary"] = salary
+                    pending.discard("salary")
+                continue
+            if value is None:
+                value = LineParser.extract_value(line)
+            if value:
+                data[field] = value
+                pending.discard(field)
+
+        for field, extract in PATTERN_FIELDS.items():
+            if field in pending:
+                found = extract(line)
+                if found:
+                    data[field] = found
+                    pending.discard(field)
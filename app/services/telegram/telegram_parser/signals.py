@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import KeyWord
+from .parser.keyword_extractor import keyword_cache
+
+
+@receiver(post_save, sender=KeyWord)
+@receiver(post_delete, sender=KeyWord)
+def invalidate_keyword_cache(sender, **kwargs):
+    keyword_cache.invalidate()
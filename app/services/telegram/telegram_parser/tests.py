@@ -0,0 +1,311 @@
+import tempfile
+from datetime import UTC, datetime
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from telethon.tl.types import PeerChannel
+from telethon.utils import get_peer_id
+
+from app.services.hh.hh_parser.models import Vacancy
+from app.services.ingestion.archive import RawArchive
+from app.services.ingestion.salary import salary_fields
+
+from .management.commands.benchmark_telegram_parser import LegacyParser
+from .models import KeyWord
+from .parser.corpus import load_corpus, load_golden, offline_parser
+from .parser.keyword_extractor import KeywordCache, KeywordExtractor, keyword_cache
+from .parser.keyword_matcher import KeywordMatcher
+from .parser.line_parser import LineParser, keyword_stripper
+from .parser.save_vacancy import SaveDataVacancy
+from .parser.source import MESSAGE_FIELDS
+from .parser.vacancy_parser import VacancyParser
+from .views import TelegramParserView
+
+KEYWORDS = {
+    "title": [],
+    "company": ["компания"],
+    "salary": ["зарплата", "оплата"],
+    "schedule": ["график"],
+    "city": ["город"],
+    "experience": ["опыт"],
+    "skills": ["стек", "навыки"],
+    "work_format": ["формат"],
+    "address": ["адрес"],
+    "description": ["описание"],
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(TELEGRAM_KEYWORDS_CHECK_INTERVAL=60)
+class KeywordCacheTests(TestCase):
+    def setUp(self):
+        self.keyword = KeyWord.objects.create(**KEYWORDS)
+        keyword_cache.keywords = None
+        keyword_cache.invalidate()
+
+    def test_parser_reads_keywords_once(self):
+        parser = VacancyParser()
+        async_to_sync(parser.parse_vacancy_from_text)("Python\nКомпания: Ozon")
+
+        with self.assertNumQueries(0):
+            parsed = async_to_sync(parser.parse_vacancy_from_text)("Go\nКомпания: Авито")
+        self.assertEqual(parsed["company"], "Авито")
+
+    def test_save_in_process_invalidates_cache(self):
+        parser = VacancyParser()
+        async_to_sync(parser.load_keywords)()
+
+        self.keyword.company = ["работодатель"]
+        self.keyword.save()
+        parsed = async_to_sync(parser.parse_vacancy_from_text)(
+            "Python\nРаботодатель: Ozon"
+        )
+
+        self.assertEqual(parsed["company"], "Ozon")
+
+    def test_change_from_other_process_is_seen_after_interval(self):
+        clock = FakeClock()
+        cache = KeywordCache(clock=clock)
+        cache.refresh()
+        self.assertFalse(cache.needs_check())
+
+        # update() не шлёт сигналов, как и изменение из другого процесса
+        KeyWord.objects.filter(id=self.keyword.id).update(
+            city=["локация"], updated_at=timezone.now()
+        )
+        clock.now += 61
+        self.assertTrue(cache.needs_check())
+
+        self.assertEqual(cache.refresh()["city"], ["локация"])
+
+    def test_salary_stripper_is_rebuilt_only_on_change(self):
+        clock = FakeClock()
+        cache = KeywordCache(clock=clock)
+        with patch(
+            "app.services.telegram.telegram_parser.parser.keyword_extractor."
+            "keyword_stripper",
+            wraps=keyword_stripper,
+        ) as build:
+            cache.refresh()
+            clock.now += 61
+            cache.refresh()
+            self.assertEqual(build.call_count, 1)
+
+            self.keyword.salary = ["з/п"]
+            self.keyword.save()
+            cache.refresh()
+            build.assert_called_with(["з/п"])
+
+    def test_missing_keywords_raise(self):
+        KeyWord.objects.all().delete()
+
+        with self.assertRaisesMessage(ValueError, "KeyWords data not found"):
+            KeywordCache().refresh()
+
+
+class KeywordMatcherTests(SimpleTestCase):
+    def test_same_fields_as_substring_search(self):
+        corpus = load_corpus()
+        keywords = corpus["keywords"]
+        matcher = KeywordMatcher(keywords)
+
+        for post in corpus["posts"]:
+            for line in post.lower().splitlines():
+                expected = {
+                    field
+                    for field, words in keywords.items()
+                    if any(word in line for word in words)
+                }
+                self.assertEqual(matcher.fields(line), expected, line)
+
+    def test_overlapping_and_empty_keywords(self):
+        matcher = KeywordMatcher(
+            {"a": ["she"], "b": ["he", "hers"], "c": ["sh", "x"], "d": [""]}
+        )
+
+        self.assertEqual(matcher.fields("ushers"), {"a", "b", "c", "d"})
+        self.assertEqual(matcher.fields("h"), {"d"})
+
+
+class BenchmarkTelegramParserCommandTests(SimpleTestCase):
+    def test_reports_both_matchers(self):
+        stdout = StringIO()
+        call_command(
+            "benchmark_telegram_parser", "--copies", "1", "--repeat", "1", stdout=stdout
+        )
+
+        self.assertIn("legacy: 30 постов", stdout.getvalue())
+        self.assertIn("Ускорение", stdout.getvalue())
+
+
+class VacancyParserGoldenTests(SimpleTestCase):
+    def assertMatchesGolden(self, parser_class):
+        corpus = load_corpus()
+        parser = offline_parser(parser_class, corpus["keywords"])
+
+        for post, expected in zip(corpus["posts"], load_golden(), strict=True):
+            parsed = parser.parse_text(post)
+            self.assertEqual(
+                {key: value for key, value in parsed.items() if value is not None},
+                expected,
+                post,
+            )
+
+    def test_single_pass_parser_matches_golden_corpus(self):
+        self.assertMatchesGolden(VacancyParser)
+
+    def test_legacy_parser_matches_golden_corpus(self):
+        self.assertMatchesGolden(LegacyParser)
+
+
+class LineParserTests(SimpleTestCase):
+    def test_salary_keywords_are_literal(self):
+        stripper = keyword_stripper(["з/п (руб.)", "ЗП", "", "оплата 2/2"])
+
+        self.assertEqual(
+            LineParser.extract_salary("З/П (руб.): от 120 000", stripper), "от 120 000"
+        )
+        self.assertEqual(
+            LineParser.extract_salary("Оплата 2/2: 3 500 за смену", stripper), "3 500"
+        )
+        self.assertIsNone(LineParser.extract_salary("зп: договорная", stripper))
+        self.assertEqual(
+            LineParser.extract_salary("до 90 000", keyword_stripper([])), "90 000"
+        )
+
+    def test_phone_username_and_link(self):
+        self.assertEqual(
+            LineParser.extract_phone("Тел: +7 (921) 123-45-67"), "+7 (921) 123-45-67"
+        )
+        self.assertEqual(LineParser.extract_phone("Пишите @hr, +7 921 1234567"), "@hr")
+        self.assertIsNone(LineParser.extract_phone("Звонить 8 921123-45-67"))
+        self.assertEqual(
+            LineParser.extract_link("Отклик: t.me/jobs, сайт"), "t.me/jobs,"
+        )
+        self.assertEqual(LineParser.extract_value("Город — Москва"), "Москва")
+
+
+class SaveDataVacancyTests(TestCase):
+    def test_saves_and_archives_post(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        parsed = {
+            **dict.fromkeys(MESSAGE_FIELDS),
+            "title": "Python-разработчик",
+            "company": "Ozon",
+            "salary_from": 200000,
+            "salary_currency": "RUB",
+        }
+        date = datetime(2025, 7, 1, tzinfo=UTC)
+
+        with override_settings(
+            INGESTION_ARCHIVE_ENABLED=True, INGESTION_ARCHIVE_DIR=tmp.name
+        ):
+            save = SaveDataVacancy()
+            async_to_sync(save.save_vacancy)(parsed, date, "Python-разработчик")
+
+        vacancy = Vacancy.objects.get()
+        self.assertEqual(vacancy.platform.name, "Telegram")
+        self.assertEqual(vacancy.company.name, "Ozon")
+        self.assertEqual(vacancy.published_at, date)
+        [record] = RawArchive(tmp.name).iter_records("Telegram")
+        self.assertEqual(record["payload"]["text"], "Python-разработчик")
+        self.assertEqual(vacancy.platform_vacancy_id, f"Telegram{record['key']}")
+
+    def test_edited_post_updates_vacancy(self):
+        parsed = {
+            **dict.fromkeys(MESSAGE_FIELDS),
+            **salary_fields(),
+            "title": "Python-разработчик",
+        }
+        date = datetime(2025, 7, 1, tzinfo=UTC)
+        save = SaveDataVacancy()
+
+        async_to_sync(save.save_vacancy)(parsed, date, "", JOBS, 42)
+        async_to_sync(save.save_vacancy)(
+            {**parsed, "title": "Senior Python-разработчик"}, date, "", JOBS, 42
+        )
+
+        vacancy = Vacancy.objects.get()
+        self.assertEqual(vacancy.title, "Senior Python-разработчик")
+        self.assertEqual(vacancy.platform_vacancy_id, f"Telegram{JOBS}:42")
+        self.assertLessEqual(
+            len(vacancy.platform_vacancy_id),
+            Vacancy._meta.get_field("platform_vacancy_id").max_length,
+        )
+
+
+class FakeTelegramClient:
+    def __init__(self, channels):
+        self.channels = channels
+        self.handlers = []
+
+    def add_event_handler(self, callback, event):
+        self.handlers.append((callback, event))
+
+    async def get_entity(self, username):
+        if username not in self.channels:
+            raise ValueError(f"No user has {username} as username")
+        return PeerChannel(self.channels[username])
+
+
+JOBS = get_peer_id(PeerChannel(101))
+IT_JOBS = get_peer_id(PeerChannel(202))
+
+
+class TelegramParserViewTests(SimpleTestCase):
+    def setUp(self):
+        client = FakeTelegramClient({"jobs": 101, "it_jobs": 202})
+        self.view = TelegramParserView()
+        with (
+            patch(
+                "app.services.telegram.telegram_parser.views.TelegramChannelClient"
+                ".create",
+                AsyncMock(return_value=SimpleNamespace(client=client)),
+            ),
+            patch.object(KeywordExtractor, "load_keywords", AsyncMock()),
+        ):
+            async_to_sync(self.view.initialize)()
+        self.view.vacancy = SimpleNamespace(
+            parse_vacancy_from_text=AsyncMock(return_value={"title": "Python"})
+        )
+        self.view.save = SimpleNamespace(save_vacancy=AsyncMock())
+
+    def post(self, chat_id):
+        message = SimpleNamespace(message="Python", date=timezone.now(), id=1)
+        async_to_sync(self.view.new_post_handler)(
+            SimpleNamespace(chat_id=chat_id, message=message)
+        )
+
+    def test_dispatches_only_subscribed_channels(self):
+        async_to_sync(self.view.update_channels)(["jobs", "missing"])
+
+        self.post(JOBS)
+        self.post(IT_JOBS)
+
+        self.assertEqual(self.view.channels, {JOBS: "jobs"})
+        self.view.save.save_vacancy.assert_awaited_once()
+
+    def test_channel_set_changes_without_new_handlers(self):
+        async_to_sync(self.view.update_channels)(["jobs"])
+        async_to_sync(self.view.update_channels)(["it_jobs"])
+
+        self.post(JOBS)
+        self.view.save.save_vacancy.assert_not_awaited()
+        self.post(IT_JOBS)
+        self.view.save.save_vacancy.assert_awaited_once()
+        self.assertEqual(self.view.channel_ids, {"it_jobs": IT_JOBS})
+        # NewMessage и MessageEdited, зарегистрированные при initialize()
+        self.assertEqual(len(self.view.client.handlers), 2)
@@ -9,6 +9,7 @@ from telethon.errors import (
     RPCError,
     SessionPasswordNeededError,
 )
+from telethon.utils import get_peer_id
 
 from app.services.telegram.telegram_client import TelegramChannelClient
 
@@ -21,11 +22,25 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramParserView:
+    """Слушатель каналов на одном клиенте Telethon.
+
+    Зарегистрирован один обработчик NewMessage и MessageEdited без
+    фильтра по чатам: он сразу отбрасывает сообщения из чатов, которых нет
+    в self.channels (поиск в словаре по chat_id), поэтому число каналов не
+    влияет ни на число обработчиков, ни на стоимость фильтрации обновления.
+    Отредактированный пост сохраняется под тем же ключом и обновляет
+    вакансию.
+    update_channels() меняет набор каналов без перерегистрации обработчика.
+    """
+
     def __init__(self):
         self.client = None
         self.keywords = KeywordExtractor()
         self.vacancy = VacancyParser()
         self.save = SaveDataVacancy()
+        # chat_id -> username и обратно для сверки с активными каналами
+        self.channels = {}
+        self.channel_ids = {}
 
     async def initialize(self):
         client_wrapper = await TelegramChannelClient.create()
@@ -33,20 +48,44 @@ class TelegramParserView:
         self.vacancy = VacancyParser()
         self.keywords = KeywordExtractor()
         await self.keywords.load_keywords()
+        self.client.add_event_handler(self.new_post_handler, events.NewMessage())
+        self.client.add_event_handler(self.new_post_handler, events.MessageEdited())
+
+    async def update_channels(self, usernames):
+        """Подписывает на новые активные каналы и отписывает от выбывших."""
+        usernames = set(usernames)
+        for username in set(self.channel_ids) - usernames:
+            chat_id = self.channel_ids.pop(username)
+            self.channels.pop(chat_id, None)
+            logger.info(f"⏹ Отключение от канала: {username}")
 
-    async def channel_listener(self, channel_username):
-        @self.client.on(events.NewMessage(chats=channel_username))
-        async def new_post_handler(event):
-            message = event.message.message
-            parsed = await self.vacancy.parse_vacancy_from_text(message)
-            if parsed:
-                try:
-                    await self.save.save_vacancy(parsed, event.message.date)
-                except (IntegrityError, DataError) as e:
-                    logger.error(f"Ошибка целостности БД: {e}")
-                else:
-                    logger.info("Сохранено в БД")
+        for username in usernames - set(self.channel_ids):
+            try:
+                entity = await self.client.get_entity(username)
+            except (ValueError, RPCError) as e:
+                logger.error(f"Канал {username} не найден: {e}")
+                continue
+            chat_id = get_peer_id(entity)
+            self.channel_ids[username] = chat_id
+            self.channels[chat_id] = username
+            logger.info(f"▶️ Подключение к новому каналу: {username}")
+
+    async def new_post_handler(self, event):
+        if event.chat_id not in self.channels:
+            return
+        message = event.message.message
+        parsed = await self.vacancy.parse_vacancy_from_text(message)
+        if parsed:
+            try:
+                await self.save.save_vacancy(
+                    parsed, event.message.date, message, event.chat_id, event.message.id
+                )
+            except (IntegrityError, DataError) as e:
+                logger.error(f"Ошибка целостности БД: {e}")
+            else:
+                logger.info("Сохранено в БД")
 
+    async def run(self):
         try:
             await self.client.start()
         except AuthKeyError as e:
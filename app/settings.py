@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     "app.services.telegram.telegram_parser",
     "app.services.telegram.telegram_channels",
     "app.services.superjob.superjob_parser",
+    "app.services.ingestion",
     "app.services.account",
     "django_vite",
     "app.services.auth.tinkoff_id",
@@ -224,3 +225,51 @@ TINKOFF_ID_TOKEN_URL = "https://id.tinkoff.ru/auth/token"
 TINKOFF_ID_USERINFO_URL = "https://id.tinkoff.ru/userinfo/userinfo"
 TINKOFF_ID_INTROSPECT_URL = "https://id.tinkoff.ru/auth/introspect"
 TINKOFF_ID_SCOPE = ["profile", "email"]
+
+# HH parser settings
+HH_DETAIL_CONCURRENCY = int(os.getenv("HH_DETAIL_CONCURRENCY", 8))
+HH_DETAIL_BATCH_SIZE = int(os.getenv("HH_DETAIL_BATCH_SIZE", 100))
+# requests per second allowed against api.hh.ru
+HH_RATE_LIMIT = float(os.getenv("HH_RATE_LIMIT", 5))
+# depth of the HH search window, HH keeps vacancies searchable for 30 days
+HH_SEARCH_PERIOD_DAYS = int(os.getenv("HH_SEARCH_PERIOD_DAYS", 30))
+
+# SuperJob parser settings
+# requests per second allowed against api.superjob.ru
+SUPERJOB_RATE_LIMIT = float(os.getenv("SUPERJOB_RATE_LIMIT", 2))
+SUPERJOB_SEARCH_PERIOD_DAYS = int(os.getenv("SUPERJOB_SEARCH_PERIOD_DAYS", 30))
+
+# Telegram parser settings
+# seconds between checks whether KeyWord rows were changed by another process
+TELEGRAM_KEYWORDS_CHECK_INTERVAL = float(
+    os.getenv("TELEGRAM_KEYWORDS_CHECK_INTERVAL", 60)
+)
+
+# Ingestion settings
+INGESTION_WRITE_CHUNK_SIZE = int(os.getenv("INGESTION_WRITE_CHUNK_SIZE", 500))
+# cache Platform/Company/City ids across runs in a process (LRU-bounded)
+INGESTION_SHARED_DIMENSION_CACHE = os.getenv(
+    "INGESTION_SHARED_DIMENSION_CACHE", "False"
+).lower() in ("true", "1", "yes")
+INGESTION_DIMENSION_CACHE_SIZE = int(os.getenv("INGESTION_DIMENSION_CACHE_SIZE", 50000))
+# conversion rates to RUB used for Vacancy.salary_rub_monthly
+INGESTION_CURRENCY_RATES_FILE = os.getenv(
+    "INGESTION_CURRENCY_RATES_FILE",
+    BASE_DIR / "app" / "services" / "ingestion" / "data" / "currency_rates.json",
+)
+# append-only archive of raw API payloads for the reparse command
+INGESTION_ARCHIVE_ENABLED = os.getenv("INGESTION_ARCHIVE_ENABLED", "False").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+INGESTION_ARCHIVE_DIR = os.getenv("INGESTION_ARCHIVE_DIR", BASE_DIR / "var" / "archive")
+# processes used to map API payloads, 0 maps them in a thread of the pipeline
+INGESTION_PARSE_WORKERS = int(os.getenv("INGESTION_PARSE_WORKERS", 0))
+INGESTION_PARSE_CHUNK_SIZE = int(os.getenv("INGESTION_PARSE_CHUNK_SIZE", 50))
+# bound of the queues between fetch, parse and persist stages
+INGESTION_QUEUE_SIZE = int(os.getenv("INGESTION_QUEUE_SIZE", 1000))
+# seconds after which a run still marked running is considered dead
+INGESTION_RUN_TIMEOUT = int(os.getenv("INGESTION_RUN_TIMEOUT", 3 * 60 * 60))
+# number of HH crawl plans searched in parallel
+HH_PLAN_CONCURRENCY = int(os.getenv("HH_PLAN_CONCURRENCY", 4))
@@ -25,6 +25,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("hh/", include("app.services.hh.hh_parser.urls")),
     path("superjob/", include("app.services.superjob.superjob_parser.urls")),
+    path("ingestion/", include("app.services.ingestion.urls")),
     path("telegram/", include("app.services.telegram.telegram_channels.urls")),
     path("auth/", include("app.services.auth.users.urls")),
     path("account/", include("app.services.account.urls")),